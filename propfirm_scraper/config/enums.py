@@ -39,4 +39,40 @@ class Broker(Enum):
     RITHMIC = "RITHMIC"
     CQG = "CQG"
     UNKNOWN = "UNKNOWN"
-    MULTIPLE = "MULTIPLE"
\ No newline at end of file
+    MULTIPLE = "MULTIPLE"
+
+# Keyword tables used by core.utils classifiers, checked in order; first match wins
+DRAWDOWN_KEYWORDS = (
+    (DrawdownType.TRAILING, ('trailing', 'trail')),
+    (DrawdownType.STATIC, ('static', 'fixed', 'absolute')),
+    (DrawdownType.EOD, ('eod', 'end of day', 'daily close', 'close of day')),
+    (DrawdownType.HYBRID, ('hybrid', 'combination', 'mixed')),
+)
+
+WEEKLY_KEYWORDS = ('weekly', 'week', '7 days')
+BIWEEKLY_HINT_KEYWORDS = ('bi', 'bi-weekly', 'biweekly', '2 weeks', 'two weeks')
+PAYOUT_KEYWORDS = (
+    (PayoutFrequency.MONTHLY, ('monthly', 'month', '30 days')),
+    (PayoutFrequency.ON_DEMAND, ('on demand', 'on-demand', 'instant', 'immediate', 'anytime')),
+    (PayoutFrequency.BIWEEKLY, ('biweekly', 'bi-weekly', '2 weeks', 'two weeks', '14 days')),
+)
+
+PLATFORM_KEYWORDS = (
+    (Platform.MT4, ('mt4', 'metatrader 4')),
+    (Platform.MT5, ('mt5', 'metatrader 5')),
+    (Platform.CTRADER, ('ctrader', 'c-trader')),
+    (Platform.NINJA_TRADER, ('ninjatrader', 'ninja trader')),
+    (Platform.TRADING_VIEW, ('tradingview', 'trading view')),
+    (Platform.PROPRIETARY, ('proprietary', 'custom', 'own platform')),
+    (Platform.MULTIPLE, ('multiple', 'various', 'several')),
+)
+
+BROKER_KEYWORDS = (
+    (Broker.PURPLE_TRADING, ('purple trading', 'purple')),
+    (Broker.EIGHTCAP, ('eightcap', '8cap')),
+    (Broker.MATCH_TRADER, ('match trader', 'matchtrader')),
+    (Broker.TOPSTEP, ('topstep',)),
+    (Broker.RITHMIC, ('rithmic',)),
+    (Broker.CQG, ('cqg',)),
+    (Broker.MULTIPLE, ('multiple', 'various', 'several')),
+)
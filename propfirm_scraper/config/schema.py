@@ -2,11 +2,37 @@
 Data schema definitions for trading rule extraction
 """
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from .enums import DrawdownType, PayoutFrequency, Status, Platform, Broker
 
-@dataclass
+# Export column headers, in the order of TradingRule.to_row()
+EXPORT_HEADERS = (
+    'Firm Name',
+    'Account Size',
+    'Account Size (USD)',
+    'Website URL',
+    'Broker',
+    'Platform',
+    'Last Updated',
+    'Status',
+    'Evaluation Target (USD)',
+    'Evaluation Max Drawdown (USD)',
+    'Evaluation Daily Loss (USD)',
+    'Evaluation Drawdown Type',
+    'Evaluation Min Days',
+    'Evaluation Consistency',
+    'Funded Max Drawdown (USD)',
+    'Funded Daily Loss (USD)',
+    'Funded Drawdown Type',
+    'Profit Split (%)',
+    'Payout Frequency',
+    'Min Payout (USD)',
+    'Evaluation Fee (USD)',
+    'Reset Fee (USD)',
+)
+
+@dataclass(slots=True)
 class TradingRule:
     """Complete trading rule data structure for one firm + account size"""
     
@@ -45,40 +71,44 @@ class TradingRule:
     # Raw data for debugging
     raw_data: Dict[str, Any] = field(default_factory=dict)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for Google Sheets export"""
-        return {
-            'Firm Name': self.firm_name,
-            'Account Size': self.account_size,
-            'Account Size (USD)': self.account_size_usd,
-            'Website URL': self.website_url,
-            'Broker': self.broker.value if self.broker else None,
-            'Platform': self.platform.value if self.platform else None,
-            'Last Updated': self.last_updated.strftime('%Y-%m-%d %H:%M:%S'),
-            'Status': self.status.value,
+    def to_row(self) -> Tuple[Any, ...]:
+        """Export values in EXPORT_HEADERS order, read straight from the attributes"""
+        return (
+            self.firm_name,
+            self.account_size,
+            self.account_size_usd,
+            self.website_url,
+            self.broker.value if self.broker else None,
+            self.platform.value if self.platform else None,
+            self.last_updated.strftime('%Y-%m-%d %H:%M:%S'),
+            self.status.value,
             
             # Evaluation Phase
-            'Evaluation Target (USD)': self.evaluation_target_usd,
-            'Evaluation Max Drawdown (USD)': self.evaluation_max_drawdown_usd,
-            'Evaluation Daily Loss (USD)': self.evaluation_daily_loss_usd,
-            'Evaluation Drawdown Type': self.evaluation_drawdown_type.value if self.evaluation_drawdown_type else None,
-            'Evaluation Min Days': self.evaluation_min_days,
-            'Evaluation Consistency': self.evaluation_consistency,
+            self.evaluation_target_usd,
+            self.evaluation_max_drawdown_usd,
+            self.evaluation_daily_loss_usd,
+            self.evaluation_drawdown_type.value if self.evaluation_drawdown_type else None,
+            self.evaluation_min_days,
+            self.evaluation_consistency,
             
             # Funded Phase
-            'Funded Max Drawdown (USD)': self.funded_max_drawdown_usd,
-            'Funded Daily Loss (USD)': self.funded_daily_loss_usd,
-            'Funded Drawdown Type': self.funded_drawdown_type.value if self.funded_drawdown_type else None,
+            self.funded_max_drawdown_usd,
+            self.funded_daily_loss_usd,
+            self.funded_drawdown_type.value if self.funded_drawdown_type else None,
             
             # Payout
-            'Profit Split (%)': self.profit_split_percent,
-            'Payout Frequency': self.payout_frequency.value if self.payout_frequency else None,
-            'Min Payout (USD)': self.min_payout_usd,
+            self.profit_split_percent,
+            self.payout_frequency.value if self.payout_frequency else None,
+            self.min_payout_usd,
             
             # Fees
-            'Evaluation Fee (USD)': self.evaluation_fee_usd,
-            'Reset Fee (USD)': self.reset_fee_usd,
-        }
+            self.evaluation_fee_usd,
+            self.reset_fee_usd,
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for Google Sheets export"""
+        return dict(zip(EXPORT_HEADERS, self.to_row()))
 
 @dataclass
 class SiteConfig:
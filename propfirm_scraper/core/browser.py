@@ -1,25 +1,199 @@
 """
 Browser management using Playwright
 """
+import re
 import asyncio
 import logging
 from typing import Optional, Dict, Any
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Anti-detection script, registered once on the shared context
+STEALTH_INIT_SCRIPT = """
+    // Remove webdriver property
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+    
+    // Mock chrome property
+    window.chrome = {
+        runtime: {},
+    };
+    
+    // Mock permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+"""
+
+# Known help/support sites that never need login
+HELP_DOMAINS = [
+    'support.apextraderfunding.com',
+    'support.lucidtrading.com',
+    'help.tradeify.co',
+    'help.myfundedfutures.com',
+    'helpfutures.fundednext.com',
+    'help.alpha-futures.com',
+    'intercom.help',
+    'help.blueguardianfutures.com',
+    'support.thetradingpit.com',
+    'knowledge.thelegendstrading.com',
+    'helpfutures.e8markets.com',
+    'zendesk.com'
+]
+
+LOGIN_URL_KEYWORDS = ['/login', '/signin', '/auth/login', '/authentication']
+
+ACCESS_DENIED_KEYWORDS = [
+    'access denied',
+    'unauthorized',
+    'please log in',
+    'you must be logged in',
+    'authentication required'
+]
+
+# Keyword lists compiled into single alternations so each check is one scan
+HELP_DOMAIN_PATTERN = re.compile('|'.join(map(re.escape, HELP_DOMAINS)))
+LOGIN_URL_PATTERN = re.compile('|'.join(map(re.escape, LOGIN_URL_KEYWORDS)))
+ACCESS_DENIED_PATTERN = re.compile('|'.join(map(re.escape, ACCESS_DENIED_KEYWORDS)))
+
+# Resources the extractors never read; stylesheets stay so CSS-driven visibility still works
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+
+BLOCKED_HOSTS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'hotjar.com',
+    'clarity.ms',
+    'segment.io',
+]
+BLOCKED_HOST_PATTERN = re.compile('|'.join(map(re.escape, BLOCKED_HOSTS)))
+
+# Strict login indicators (avoid false positives)
+LOGIN_SELECTORS = [
+    'form[action*="login"]',
+    'form[action*="signin"]',
+    '.login-form',
+    '.signin-form',
+    'input[name="username"]',
+    'input[name="email"][type="email"] + input[type="password"]'  # Email + password combo
+]
+
+# Common accordion selectors
+ACCORDION_SELECTORS = [
+    '[data-toggle="collapse"]',
+    '.accordion-button',
+    '.collapsible-header',
+    '.expand-button',
+    '.toggle-button',
+    '[aria-expanded="false"]',
+    'details summary',
+]
+
+SEARCH_SELECTORS = [
+    'input[type="search"]',
+    'input[name*="search"]',
+    'input[id*="search"]',
+    'input[placeholder*="search"]',
+    'input[placeholder*="Search"]',
+    '.search-input',
+    '.search-field',
+    '#search',
+    '[data-testid*="search"]',
+]
+
+# Each list folded into one :is() union so a lookup is a single query
+LOGIN_SELECTOR_UNION = f":is({', '.join(LOGIN_SELECTORS)})"
+ACCORDION_SELECTOR_UNION = f":is({', '.join(ACCORDION_SELECTORS)})"
+SEARCH_SELECTOR_UNION = f":is({', '.join(SEARCH_SELECTORS)})"
+
+# Access-denied messages sit near the top of a login wall, so only this much body text is read
+LOGIN_TEXT_SAMPLE_CHARS = 4000
+
+# Returns whether a visible login form exists, the title, and the start of the body text
+LOGIN_STATE_SCRIPT = """
+([selector, sampleChars]) => {
+    const hasLoginForm = Array.from(document.querySelectorAll(selector)).some(
+        el => el.offsetWidth || el.offsetHeight || el.getClientRects().length
+    );
+    const text = document.body ? document.body.innerText.slice(0, sampleChars) : '';
+    return {has_login_form: hasLoginForm, title: document.title, text: text};
+}
+"""
+
+# Clicks all visible elements matching the selector, returns how many were clicked
+EXPAND_ACCORDIONS_SCRIPT = """
+(selector) => {
+    let clicked = 0;
+    document.querySelectorAll(selector).forEach(el => {
+        if (el.offsetWidth || el.offsetHeight || el.getClientRects().length) {
+            try {
+                el.click();
+                clicked++;
+            } catch (e) {}
+        }
+    });
+    return clicked;
+}
+"""
+
+# Words that mark a search result page as useful
+SEARCH_RESULT_KEYWORDS = ['drawdown', 'profit', 'target', 'rules']
+
+# Only the start of the results area is checked, so large pages are never copied in full
+SEARCH_RESULTS_SAMPLE_CHARS = 1500
+
+# Truthy once the results area (or the body, if none is found) mentions any of the keywords
+SEARCH_RESULTS_SCRIPT = """
+([keywords, sampleChars]) => {
+    const root = document.querySelector('[class*="search-results"], main, #content') || document.body;
+    const text = root ? root.innerText.slice(0, sampleChars).toLowerCase() : '';
+    return keywords.some(keyword => text.includes(keyword));
+}
+"""
+
 class BrowserManager:
     """Manage Playwright browser instances"""
     
-    def __init__(self, headless: bool = True, timeout: int = 30000):
+    def __init__(self, headless: bool = True, timeout: int = 30000, max_pages: int = 8,
+                 recycle_every: int = 10):
         self.headless = headless
         self.timeout = timeout
+        # Caps how many pages can be open at once; a slot is freed when its page closes
+        self._page_slots = asyncio.Semaphore(max_pages)
+        # A long-lived context keeps growing in memory, so it is replaced
+        # after this many pages, once none of its pages are open (0 disables).
+        # Every page opened on the context is counted, not only new_page ones.
+        self.recycle_every = recycle_every
+        self._pages_since_recycle = 0
+        self._open_pages = 0
+        # Set while the context has no open pages
+        self._drained = asyncio.Event()
+        self._drained.set()
+        # Serializes page creation with context replacement
+        self._context_lock = asyncio.Lock()
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        # Serializes start() so concurrent callers share one driver and browser
+        self._start_lock = asyncio.Lock()
         
     async def start(self):
-        """Start the browser"""
+        """Start the browser, reusing the running instance if already started"""
+        async with self._start_lock:
+            if self.context:
+                return
+            await self._launch()
+    
+    async def _launch(self):
+        """Start the Playwright driver, launch the browser and create the shared context"""
         try:
             self.playwright = await async_playwright().start()
             
@@ -34,14 +208,7 @@ class BrowserManager:
                 ]
             )
             
-            # Create context with realistic settings
-            self.context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            # Set default timeout
-            self.context.set_default_timeout(self.timeout)
+            self.context = await self._new_context()
             
             logger.info("Browser started successfully")
             
@@ -49,39 +216,81 @@ class BrowserManager:
             logger.error(f"Failed to start browser: {e}")
             raise
     
+    async def _new_context(self, storage_state: Optional[Dict[str, Any]] = None) -> BrowserContext:
+        """Create a context with realistic settings, the stealth script and the request filter"""
+        context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            storage_state=storage_state
+        )
+        
+        # Set default timeout
+        context.set_default_timeout(self.timeout)
+        
+        # Applies to every page opened from this context
+        await context.add_init_script(STEALTH_INIT_SCRIPT)
+        await context.route('**/*', self._filter_request)
+        context.on('page', self._page_opened)
+        
+        return context
+    
+    async def _recycle_context(self):
+        """Replace the shared context with a fresh one, carrying over cookies and storage"""
+        storage_state = await self.context.storage_state()
+        await self.context.close()
+        self.context = await self._new_context(storage_state)
+        self._pages_since_recycle = 0
+        logger.info("Browser context recycled")
+    
+    def _page_opened(self, page: Page):
+        """Count a page opened on the context, by new_page or directly by an extractor"""
+        self._open_pages += 1
+        self._pages_since_recycle += 1
+        self._drained.clear()
+        page.once('close', lambda _: self._page_closed())
+    
+    def _page_closed(self):
+        """Count a page as no longer open"""
+        self._open_pages -= 1
+        if self._open_pages == 0:
+            self._drained.set()
+    
+    async def _filter_request(self, route):
+        """Abort requests for heavy or tracking resources, let everything else through"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_HOST_PATTERN.search(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+    
     async def new_page(self) -> Page:
         """Create a new page"""
         if not self.context:
             await self.start()
         
-        page = await self.context.new_page()
-        
-        # Set up page with anti-detection measures
-        await page.add_init_script("""
-            // Remove webdriver property
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined,
-            });
-            
-            // Mock chrome property
-            window.chrome = {
-                runtime: {},
-            };
-            
-            // Mock permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-        """)
+        await self._page_slots.acquire()
+        try:
+            async with self._context_lock:
+                # Once the context is due, hold back new pages until the
+                # running sites close theirs, then swap it while nothing is open
+                if self.recycle_every and self._pages_since_recycle >= self.recycle_every:
+                    await self._drained.wait()
+                    await self._recycle_context()
+                
+                page = await self.context.new_page()
+        except Exception:
+            self._page_slots.release()
+            raise
         
+        # Free the slot when the page closes
+        page.once('close', lambda _: self._page_slots.release())
         return page
     
     async def load_page(self, url: str, page: Optional[Page] = None) -> Page:
         """Load a page with the given URL"""
-        if page is None:
+        # A page opened here is closed here on failure, the caller never sees it
+        owns_page = page is None
+        if owns_page:
             page = await self.new_page()
         
         try:
@@ -93,65 +302,41 @@ class BrowserManager:
             if response and response.status >= 400:
                 logger.warning(f"Page loaded with status {response.status}: {url}")
             
-            # Wait for page to be ready
-            await page.wait_for_load_state('networkidle', timeout=10000)
+            # Give the page a short, capped chance to settle; analytics-heavy
+            # sites may never go network-idle, and the DOM is already usable
+            try:
+                await page.wait_for_load_state('networkidle', timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"Network did not settle, continuing: {url}")
             
             logger.info(f"Page loaded successfully: {url}")
             return page
             
         except Exception as e:
             logger.error(f"Failed to load page {url}: {e}")
+            if owns_page:
+                await page.close()
             raise
     
     async def detect_login_page(self, page: Page) -> bool:
         """Detect if the current page requires login"""
         try:
-            # Get page content first
-            content = await page.content()
-            title = await page.title()
             url = page.url
             
             # Skip login detection for known support/help sites
-            help_domains = [
-                'support.apextraderfunding.com',
-                'support.lucidtrading.com', 
-                'help.tradeify.co',
-                'help.myfundedfutures.com',
-                'helpfutures.fundednext.com',
-                'help.alpha-futures.com',
-                'intercom.help',
-                'help.blueguardianfutures.com',
-                'support.thetradingpit.com',
-                'knowledge.thelegendstrading.com',
-                'helpfutures.e8markets.com',
-                'zendesk.com'
-            ]
-            
-            # Check if this is a known help/support domain
-            for domain in help_domains:
-                if domain in url:
-                    logger.info(f"Skipping login detection for help/support domain: {domain}")
-                    return False
+            domain_match = HELP_DOMAIN_PATTERN.search(url)
+            if domain_match:
+                logger.info(f"Skipping login detection for help/support domain: {domain_match.group(0)}")
+                return False
             
-            # More specific login indicators (avoid false positives)
-            strict_login_indicators = [
-                'form[action*="login"]',
-                'form[action*="signin"]',
-                '.login-form',
-                '.signin-form',
-                'input[name="username"]',
-                'input[name="email"][type="email"] + input[type="password"]'  # Email + password combo
-            ]
+            # Login form, title and a text sample in one round-trip
+            state = await page.evaluate(LOGIN_STATE_SCRIPT, [LOGIN_SELECTOR_UNION, LOGIN_TEXT_SAMPLE_CHARS])
+            title = state['title']
             
             # Check for strict login indicators
-            for selector in strict_login_indicators:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        logger.warning(f"Login required - found: {selector}")
-                        return True
-                except:
-                    continue
+            if state['has_login_form']:
+                logger.warning("Login required - found visible login form element")
+                return True
             
             # Check for login-specific page titles (more restrictive)
             login_title_keywords = ['login', 'sign in', 'authenticate']
@@ -163,23 +348,12 @@ class BrowserManager:
                 return True
             
             # Check for login-specific URLs (more restrictive)
-            login_url_patterns = ['/login', '/signin', '/auth/login', '/authentication']
-            
-            if any(pattern in url.lower() for pattern in login_url_patterns):
+            if LOGIN_URL_PATTERN.search(url.lower()):
                 logger.warning(f"Login required - login URL pattern: {url}")
                 return True
             
             # Check for "access denied" or "unauthorized" messages
-            content_lower = content.lower()
-            access_denied_keywords = [
-                'access denied',
-                'unauthorized',
-                'please log in',
-                'you must be logged in',
-                'authentication required'
-            ]
-            
-            if any(keyword in content_lower for keyword in access_denied_keywords):
+            if ACCESS_DENIED_PATTERN.search(state['text'].lower()):
                 logger.warning(f"Login required - access denied message found")
                 return True
             
@@ -192,33 +366,8 @@ class BrowserManager:
     async def expand_accordions(self, page: Page):
         """Expand all accordion/collapsible elements on the page"""
         try:
-            # Common accordion selectors
-            accordion_selectors = [
-                '[data-toggle="collapse"]',
-                '.accordion-button',
-                '.collapsible-header',
-                '.expand-button',
-                '.toggle-button',
-                '[aria-expanded="false"]',
-                'details summary',
-            ]
-            
-            expanded_count = 0
-            
-            for selector in accordion_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
-                        try:
-                            # Check if element is visible and clickable
-                            if await element.is_visible():
-                                await element.click()
-                                expanded_count += 1
-                                await page.wait_for_timeout(500)  # Small delay
-                        except:
-                            continue
-                except:
-                    continue
+            # Click every visible match inside the page in a single round-trip
+            expanded_count = await page.evaluate(EXPAND_ACCORDIONS_SCRIPT, ACCORDION_SELECTOR_UNION)
             
             if expanded_count > 0:
                 logger.info(f"Expanded {expanded_count} accordion elements")
@@ -228,28 +377,13 @@ class BrowserManager:
             logger.error(f"Error expanding accordions: {e}")
     
     async def find_search_field(self, page: Page) -> Optional[str]:
-        """Find search input field on the page"""
+        """Find search input field on the page, returning a selector for the first visible one"""
         try:
-            search_selectors = [
-                'input[type="search"]',
-                'input[name*="search"]',
-                'input[id*="search"]',
-                'input[placeholder*="search"]',
-                'input[placeholder*="Search"]',
-                '.search-input',
-                '.search-field',
-                '#search',
-                '[data-testid*="search"]',
-            ]
-            
-            for selector in search_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        logger.info(f"Found search field: {selector}")
-                        return selector
-                except:
-                    continue
+            selector = f"{SEARCH_SELECTOR_UNION}:visible"
+            element = await page.query_selector(selector)
+            if element:
+                logger.info("Found search field")
+                return selector
             
             return None
             
@@ -274,14 +408,18 @@ class BrowserManager:
                     await page.fill(search_selector, term)
                     await page.press(search_selector, 'Enter')
                     
-                    # Wait for results
-                    await page.wait_for_timeout(3000)
-                    
-                    # Check if we got useful results
-                    content = await page.content()
-                    if any(keyword in content.lower() for keyword in ['drawdown', 'profit', 'target', 'rules']):
+                    # Re-check on every DOM mutation instead of sleeping a fixed 3s
+                    try:
+                        await page.wait_for_function(
+                            SEARCH_RESULTS_SCRIPT,
+                            arg=[SEARCH_RESULT_KEYWORDS, SEARCH_RESULTS_SAMPLE_CHARS],
+                            polling='mutation',
+                            timeout=3000
+                        )
                         logger.info(f"Found relevant content for search term: {term}")
                         return True
+                    except PlaywrightTimeoutError:
+                        pass
                     
                 except Exception as e:
                     logger.warning(f"Search failed for term '{term}': {e}")
@@ -303,6 +441,10 @@ class BrowserManager:
             if self.playwright:
                 await self.playwright.stop()
             
+            self.context = None
+            self.browser = None
+            self.playwright = None
+            
             logger.info("Browser closed successfully")
             
         except Exception as e:
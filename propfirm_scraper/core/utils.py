@@ -2,12 +2,38 @@
 Utility functions for data extraction and processing
 """
 import re
+import sys
 import logging
 from typing import Optional, Union, List
-from ..config.enums import DrawdownType, PayoutFrequency, Platform, Broker
+from ..config.enums import (
+    DrawdownType, PayoutFrequency, Platform, Broker,
+    DRAWDOWN_KEYWORDS, WEEKLY_KEYWORDS, BIWEEKLY_HINT_KEYWORDS, PAYOUT_KEYWORDS,
+    PLATFORM_KEYWORDS, BROKER_KEYWORDS,
+)
 
 logger = logging.getLogger(__name__)
 
+# Cheap precheck so digit-free text skips the heavier patterns below
+_DIGIT_PATTERN = re.compile(r'[0-9]')
+
+# Explicit minimums, searched in order before falling back to a bare "N days"
+_MIN_DAYS_PATTERNS = (
+    re.compile(r'minimum\s+([0-9]+)\s+days?'),
+    re.compile(r'at least\s+([0-9]+)\s+days?'),
+)
+_DAYS_PATTERN = re.compile(r'([0-9]+)\s+(?:trading\s+)?days?')
+
+# Substring tests for parse_boolean, one scan per side instead of one per word
+_TRUE_VALUES_PATTERN = re.compile('|'.join(map(re.escape, (
+    'yes', 'true', 'required', 'mandatory', 'enabled', 'active', '1'
+))))
+_FALSE_VALUES_PATTERN = re.compile('|'.join(map(re.escape, (
+    'no', 'false', 'not required', 'optional', 'disabled', 'inactive', '0'
+))))
+
+# Account size forms: $25,000 | €25,000 | £25,000 | 25K
+_ACCOUNT_SIZE_PATTERN = re.compile(r'\$([0-9,]+)|€([0-9,]+)|£([0-9,]+)|([0-9,]+)K')
+
 def extract_number(text: str) -> Optional[float]:
     """
     Extract numeric value from text
@@ -21,8 +47,12 @@ def extract_number(text: str) -> Optional[float]:
     if not text:
         return None
     
+    text = str(text)
+    if not _DIGIT_PATTERN.search(text):
+        return None
+    
     # Clean the text
-    text = str(text).strip().replace(',', '').replace('$', '').replace('€', '').replace('£', '')
+    text = text.strip().replace(',', '').replace('$', '').replace('€', '').replace('£', '')
     
     # Look for percentage
     percent_match = re.search(r'([0-9]+\.?[0-9]*)\s*%', text)
@@ -86,7 +116,15 @@ def clean_currency(text: str) -> str:
     
     text = re.sub(r'([0-9]{4,})', add_commas, text)
     
-    return text
+    # Interned so repeated sizes across pages share one string
+    return sys.intern(text)
+
+def _match_keywords(text: str, table):
+    """Return the value of the first (value, keywords) entry with a keyword in text"""
+    for value, keywords in table:
+        if any(word in text for word in keywords):
+            return value
+    return None
 
 def classify_drawdown_type(text: str) -> Optional[DrawdownType]:
     """
@@ -103,16 +141,7 @@ def classify_drawdown_type(text: str) -> Optional[DrawdownType]:
     text = str(text).lower()
     
     # Check for specific keywords
-    if any(word in text for word in ['trailing', 'trail']):
-        return DrawdownType.TRAILING
-    elif any(word in text for word in ['static', 'fixed', 'absolute']):
-        return DrawdownType.STATIC
-    elif any(word in text for word in ['eod', 'end of day', 'daily close', 'close of day']):
-        return DrawdownType.EOD
-    elif any(word in text for word in ['hybrid', 'combination', 'mixed']):
-        return DrawdownType.HYBRID
-    
-    return None
+    return _match_keywords(text, DRAWDOWN_KEYWORDS)
 
 def classify_payout_frequency(text: str) -> Optional[PayoutFrequency]:
     """
@@ -129,18 +158,12 @@ def classify_payout_frequency(text: str) -> Optional[PayoutFrequency]:
     
     text = str(text).lower()
     
-    if any(word in text for word in ['weekly', 'week', '7 days']):
-        if any(word in text for word in ['bi', 'bi-weekly', 'biweekly', '2 weeks', 'two weeks']):
+    if any(word in text for word in WEEKLY_KEYWORDS):
+        if any(word in text for word in BIWEEKLY_HINT_KEYWORDS):
             return PayoutFrequency.BIWEEKLY
         return PayoutFrequency.WEEKLY
-    elif any(word in text for word in ['monthly', 'month', '30 days']):
-        return PayoutFrequency.MONTHLY
-    elif any(word in text for word in ['on demand', 'on-demand', 'instant', 'immediate', 'anytime']):
-        return PayoutFrequency.ON_DEMAND
-    elif any(word in text for word in ['biweekly', 'bi-weekly', '2 weeks', 'two weeks', '14 days']):
-        return PayoutFrequency.BIWEEKLY
     
-    return None
+    return _match_keywords(text, PAYOUT_KEYWORDS)
 
 def classify_platform(text: str) -> Optional[Platform]:
     """
@@ -151,22 +174,7 @@ def classify_platform(text: str) -> Optional[Platform]:
     
     text = str(text).lower()
     
-    if 'mt4' in text or 'metatrader 4' in text:
-        return Platform.MT4
-    elif 'mt5' in text or 'metatrader 5' in text:
-        return Platform.MT5
-    elif 'ctrader' in text or 'c-trader' in text:
-        return Platform.CTRADER
-    elif 'ninjatrader' in text or 'ninja trader' in text:
-        return Platform.NINJA_TRADER
-    elif 'tradingview' in text or 'trading view' in text:
-        return Platform.TRADING_VIEW
-    elif any(word in text for word in ['proprietary', 'custom', 'own platform']):
-        return Platform.PROPRIETARY
-    elif any(word in text for word in ['multiple', 'various', 'several']):
-        return Platform.MULTIPLE
-    
-    return Platform.UNKNOWN
+    return _match_keywords(text, PLATFORM_KEYWORDS) or Platform.UNKNOWN
 
 def classify_broker(text: str) -> Optional[Broker]:
     """
@@ -177,22 +185,7 @@ def classify_broker(text: str) -> Optional[Broker]:
     
     text = str(text).lower()
     
-    if 'purple trading' in text or 'purple' in text:
-        return Broker.PURPLE_TRADING
-    elif 'eightcap' in text or '8cap' in text:
-        return Broker.EIGHTCAP
-    elif 'match trader' in text or 'matchtrader' in text:
-        return Broker.MATCH_TRADER
-    elif 'topstep' in text:
-        return Broker.TOPSTEP
-    elif 'rithmic' in text:
-        return Broker.RITHMIC
-    elif 'cqg' in text:
-        return Broker.CQG
-    elif any(word in text for word in ['multiple', 'various', 'several']):
-        return Broker.MULTIPLE
-    
-    return Broker.UNKNOWN
+    return _match_keywords(text, BROKER_KEYWORDS) or Broker.UNKNOWN
 
 def extract_days(text: str) -> Optional[int]:
     """
@@ -206,23 +199,21 @@ def extract_days(text: str) -> Optional[int]:
     if not text:
         return None
     
-    text = str(text).lower()
+    text = str(text)
+    if not _DIGIT_PATTERN.search(text):
+        return None
+    
+    text = text.lower()
     
     # Look for patterns like "5 days", "minimum 5 days", etc.
-    day_patterns = [
-        r'minimum\s+([0-9]+)\s+days?',
-        r'at least\s+([0-9]+)\s+days?',
-        r'([0-9]+)\s+days?',
-        r'([0-9]+)\s+trading\s+days?',
-    ]
-    
-    for pattern in day_patterns:
-        match = re.search(pattern, text)
+    for pattern in _MIN_DAYS_PATTERNS:
+        match = pattern.search(text)
         if match:
-            try:
-                return int(match.group(1))
-            except ValueError:
-                continue
+            return int(match.group(1))
+    
+    match = _DAYS_PATTERN.search(text)
+    if match:
+        return int(match.group(1))
     
     return None
 
@@ -241,12 +232,9 @@ def parse_boolean(text: str) -> Optional[bool]:
     
     text = str(text).lower().strip()
     
-    true_values = ['yes', 'true', 'required', 'mandatory', 'enabled', 'active', '1']
-    false_values = ['no', 'false', 'not required', 'optional', 'disabled', 'inactive', '0']
-    
-    if any(val in text for val in true_values):
+    if _TRUE_VALUES_PATTERN.search(text):
         return True
-    elif any(val in text for val in false_values):
+    elif _FALSE_VALUES_PATTERN.search(text):
         return False
     
     return None
@@ -277,23 +265,16 @@ def extract_account_sizes(text: str) -> List[str]:
     
     sizes = []
     
-    # Look for currency amounts
-    currency_patterns = [
-        r'\$([0-9,]+)',  # $25,000
-        r'€([0-9,]+)',   # €25,000
-        r'£([0-9,]+)',   # £25,000
-        r'([0-9,]+)K',   # 25K
-    ]
-    
-    for pattern in currency_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            if 'K' in match:
-                # Convert K to thousands
-                number = re.sub(r'[^\d]', '', match)
-                if number:
-                    sizes.append(f"${int(number) * 1000:,}")
-            else:
-                sizes.append(f"${match}")
-    
-    return list(set(sizes))  # Remove duplicates
\ No newline at end of file
+    # One pass over the text; the captured group tells us which form matched
+    for match in _ACCOUNT_SIZE_PATTERN.finditer(text):
+        group = match.lastindex
+        value = match.group(group)
+        if group == 4:
+            # Convert K to thousands
+            number = re.sub(r'[^\d]', '', value)
+            if number:
+                sizes.append(sys.intern(f"${int(number) * 1000:,}"))
+        else:
+            sizes.append(sys.intern(f"${value}"))
+    
+    return list(dict.fromkeys(sizes))  # Remove duplicates, keep order
@@ -3,47 +3,28 @@ CSV exporter for trading rule data (fallback for Google Sheets)
 """
 import csv
 import logging
+from collections import Counter
 from typing import List
 from datetime import datetime
 from pathlib import Path
 
-from ..config.schema import TradingRule
+from ..config.schema import TradingRule, EXPORT_HEADERS
 
 logger = logging.getLogger(__name__)
 
 class CSVExporter:
     """Export trading rule data to CSV file"""
     
+    # Column headers, in the order of TradingRule.to_row()
+    _HEADERS = EXPORT_HEADERS
+    
     def __init__(self, output_dir: str = "propfirm_scraper/data"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
     def _get_headers(self) -> List[str]:
         """Get column headers for the CSV"""
-        return [
-            'Firm Name',
-            'Account Size',
-            'Account Size (USD)',
-            'Website URL',
-            'Broker',
-            'Platform',
-            'Last Updated',
-            'Status',
-            'Evaluation Target (USD)',
-            'Evaluation Max Drawdown (USD)',
-            'Evaluation Daily Loss (USD)',
-            'Evaluation Drawdown Type',
-            'Evaluation Min Days',
-            'Evaluation Consistency',
-            'Funded Max Drawdown (USD)',
-            'Funded Daily Loss (USD)',
-            'Funded Drawdown Type',
-            'Profit Split (%)',
-            'Payout Frequency',
-            'Min Payout (USD)',
-            'Evaluation Fee (USD)',
-            'Reset Fee (USD)'
-        ]
+        return list(self._HEADERS)
     
     def export_to_csv(self, trading_rules: List[TradingRule], filename: str = None) -> str:
         """
@@ -68,21 +49,12 @@ class CSVExporter:
             
             filepath = self.output_dir / filename
             
-            # Get headers
-            headers = self._get_headers()
-            
-            # Write CSV file
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            # Write CSV file, streaming rows straight from each rule
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
                 
-                # Write headers
-                writer.writerow(headers)
-                
-                # Write data rows
-                for rule in trading_rules:
-                    rule_dict = rule.to_dict()
-                    row = [rule_dict.get(header, '') for header in headers]
-                    writer.writerow(row)
+                writer.writerow(self._HEADERS)
+                writer.writerows(rule.to_row() for rule in trading_rules)
             
             logger.info(f"Exported {len(trading_rules)} trading rules to {filepath}")
             return str(filepath)
@@ -98,45 +70,38 @@ class CSVExporter:
             filename = f"trading_rules_summary_{timestamp}.txt"
             filepath = self.output_dir / filename
             
-            # Count by status
-            status_counts = {}
-            for rule in trading_rules:
-                status = rule.status.value
-                status_counts[status] = status_counts.get(status, 0) + 1
+            # Count by status and by firm
+            status_counts = Counter(rule.status.value for rule in trading_rules)
+            firm_counts = Counter(rule.firm_name for rule in trading_rules)
+            
+            # Build the whole report, then write it in one call
+            parts = [
+                "TRADING RULES SCRAPING SUMMARY\n",
+                "=" * 50 + "\n",
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"Total rules extracted: {len(trading_rules)}\n\n",
+                "STATUS BREAKDOWN:\n",
+                "-" * 20 + "\n",
+            ]
+            parts.extend(f"{status}: {count}\n" for status, count in status_counts.items())
             
-            # Count by firm
-            firm_counts = {}
+            parts.append("\nFIRM BREAKDOWN:\n")
+            parts.append("-" * 20 + "\n")
+            parts.extend(f"{firm}: {count}\n" for firm, count in firm_counts.items())
+            
+            parts.append("\nDETAILED RESULTS:\n")
+            parts.append("-" * 20 + "\n")
             for rule in trading_rules:
-                firm = rule.firm_name
-                firm_counts[firm] = firm_counts.get(firm, 0) + 1
+                parts.append(f"\n{rule.firm_name} - {rule.account_size}\n")
+                parts.append(f"  Status: {rule.status.value}\n")
+                parts.append(f"  URL: {rule.website_url}\n")
+                if rule.evaluation_target_usd:
+                    parts.append(f"  Evaluation Target: ${rule.evaluation_target_usd:,.2f}\n")
+                if rule.profit_split_percent:
+                    parts.append(f"  Profit Split: {rule.profit_split_percent}%\n")
             
-            # Write summary
             with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("TRADING RULES SCRAPING SUMMARY\n")
-                f.write("=" * 50 + "\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total rules extracted: {len(trading_rules)}\n\n")
-                
-                f.write("STATUS BREAKDOWN:\n")
-                f.write("-" * 20 + "\n")
-                for status, count in status_counts.items():
-                    f.write(f"{status}: {count}\n")
-                
-                f.write("\nFIRM BREAKDOWN:\n")
-                f.write("-" * 20 + "\n")
-                for firm, count in firm_counts.items():
-                    f.write(f"{firm}: {count}\n")
-                
-                f.write("\nDETAILED RESULTS:\n")
-                f.write("-" * 20 + "\n")
-                for rule in trading_rules:
-                    f.write(f"\n{rule.firm_name} - {rule.account_size}\n")
-                    f.write(f"  Status: {rule.status.value}\n")
-                    f.write(f"  URL: {rule.website_url}\n")
-                    if rule.evaluation_target_usd:
-                        f.write(f"  Evaluation Target: ${rule.evaluation_target_usd:,.2f}\n")
-                    if rule.profit_split_percent:
-                        f.write(f"  Profit Split: {rule.profit_split_percent}%\n")
+                f.write(''.join(parts))
             
             logger.info(f"Summary report saved to {filepath}")
             return str(filepath)
@@ -3,30 +3,59 @@ Google Sheets exporter for trading rule data
 """
 import os
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
-from google.auth.transport.requests import Request
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+# Only the light googleapiclient modules are imported here. The discovery
+# client and google-auth stack load in _authenticate, so runs that export
+# to CSV only never pay for them.
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 
-from ..config.schema import TradingRule
+# orjson serializes request bodies much faster than the json module,
+# fall back to the client's default model when it isn't installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from ..config.schema import TradingRule, EXPORT_HEADERS
 
 logger = logging.getLogger(__name__)
 
+# Rows per update request, keeps each request body small
+ROW_CHUNK_SIZE = 500
+
+# Column headers, in the order of TradingRule.to_row()
+_HEADERS = EXPORT_HEADERS
+
+class OrjsonModel(JsonModel):
+    """JsonModel that serializes request bodies with orjson"""
+    
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        return orjson.dumps(body_value).decode('utf-8')
+
 class GoogleSheetsExporter:
     """Export trading rule data to Google Sheets"""
     
     def __init__(self, sheet_id: str, service_account_file: str):
         self.sheet_id = sheet_id
         self.service_account_file = service_account_file
+        self.http = None
         self.service = None
         self._authenticate()
     
     def _authenticate(self):
         """Authenticate with Google Sheets API using service account"""
         try:
+            import httplib2
+            from google.oauth2.service_account import Credentials
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.discovery import build
+            
             # Define the scope
             SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
             
@@ -36,40 +65,26 @@ class GoogleSheetsExporter:
                 scopes=SCOPES
             )
             
+            # One authorized connection, kept alive and reused by every request
+            # and batch this exporter sends
+            self.http = AuthorizedHttp(credentials, http=httplib2.Http())
+            
             # Build the service
-            self.service = build('sheets', 'v4', credentials=credentials)
+            self.service = build(
+                'sheets', 'v4',
+                http=self.http,
+                model=OrjsonModel() if ORJSON_AVAILABLE else None,
+                cache_discovery=False
+            )
             logger.info("Successfully authenticated with Google Sheets API")
             
         except Exception as e:
             logger.error(f"Failed to authenticate with Google Sheets API: {e}")
             raise
     
-    def _get_headers(self) -> List[str]:
+    def _get_headers(self) -> Tuple[str, ...]:
         """Get column headers for the sheet"""
-        return [
-            'Firm Name',
-            'Account Size',
-            'Account Size (USD)',
-            'Website URL',
-            'Broker',
-            'Platform',
-            'Last Updated',
-            'Status',
-            'Evaluation Target (USD)',
-            'Evaluation Max Drawdown (USD)',
-            'Evaluation Daily Loss (USD)',
-            'Evaluation Drawdown Type',
-            'Evaluation Min Days',
-            'Evaluation Consistency',
-            'Funded Max Drawdown (USD)',
-            'Funded Daily Loss (USD)',
-            'Funded Drawdown Type',
-            'Profit Split (%)',
-            'Payout Frequency',
-            'Min Payout (USD)',
-            'Evaluation Fee (USD)',
-            'Reset Fee (USD)'
-        ]
+        return _HEADERS
     
     def clear_sheet(self, sheet_name: str = "Sheet1"):
         """Clear all data from the sheet"""
@@ -97,7 +112,7 @@ class GoogleSheetsExporter:
                 spreadsheetId=self.sheet_id,
                 range=f"{sheet_name}!A1:V1",
                 valueInputOption='RAW',
-                body={'values': [headers]}
+                body={'values': [list(headers)]}
             ).execute()
             
             logger.info("Headers written to sheet")
@@ -114,11 +129,7 @@ class GoogleSheetsExporter:
                 return
             
             # Convert trading rules to rows
-            rows = []
-            for rule in trading_rules:
-                rule_dict = rule.to_dict()
-                row = [rule_dict.get(header, '') for header in self._get_headers()]
-                rows.append(row)
+            rows = self._build_rows(trading_rules)
             
             # Write data starting from row 2 (after headers)
             range_name = f"{sheet_name}!A2:V{len(rows) + 1}"
@@ -136,19 +147,65 @@ class GoogleSheetsExporter:
             logger.error(f"Failed to write data: {e}")
             raise
     
+    def _build_rows(self, trading_rules: List[TradingRule]) -> List[List[Any]]:
+        """Convert trading rules to sheet rows in header order"""
+        return [list(rule.to_row()) for rule in trading_rules]
+    
+    def write_all(self, trading_rules: List[TradingRule], sheet_name: str = "Sheet1"):
+        """
+        Overwrite the sheet with headers and data in one HTTP round-trip
+        
+        Each chunk of rows and the clear of stale cells touch disjoint ranges,
+        so they can go in one batch whose parts may run in any order.
+        """
+        try:
+            rows = self._build_rows(trading_rules)
+            last_row = len(rows) + 1
+            
+            # Header row, then data in ROW_CHUNK_SIZE slices starting at row 2
+            blocks = [(1, [list(_HEADERS)])]
+            for offset in range(0, len(rows), ROW_CHUNK_SIZE):
+                blocks.append((offset + 2, rows[offset:offset + ROW_CHUNK_SIZE]))
+            
+            # Everything outside the written A1:V{last_row} block
+            stale_ranges = [f"{sheet_name}!A{last_row + 1}:Z", f"{sheet_name}!W1:Z{last_row}"]
+            
+            errors = []
+            
+            def collect_error(request_id, response, exception):
+                if exception is not None:
+                    errors.append(exception)
+            
+            batch = self.service.new_batch_http_request(callback=collect_error)
+            for start_row, values in blocks:
+                batch.add(self.service.spreadsheets().values().update(
+                    spreadsheetId=self.sheet_id,
+                    range=f"{sheet_name}!A{start_row}:V{start_row + len(values) - 1}",
+                    valueInputOption='RAW',
+                    body={'values': values}
+                ))
+            batch.add(self.service.spreadsheets().values().batchClear(
+                spreadsheetId=self.sheet_id,
+                body={'ranges': stale_ranges}
+            ))
+            batch.execute()
+            
+            if errors:
+                raise errors[0]
+            
+            logger.info(f"Written headers and {len(rows)} rows of data to sheet")
+            
+        except HttpError as e:
+            logger.error(f"Failed to write sheet: {e}")
+            raise
+    
     def export_all(self, trading_rules: List[TradingRule], sheet_name: str = "Sheet1"):
         """Complete export process: clear, write headers, write data"""
         try:
             logger.info("Starting Google Sheets export...")
             
-            # Clear existing data
-            self.clear_sheet(sheet_name)
-            
-            # Write headers
-            self.write_headers(sheet_name)
-            
-            # Write data
-            self.write_data(trading_rules, sheet_name)
+            # Write headers and data, clearing leftover rows in the same batch
+            self.write_all(trading_rules, sheet_name)
             
             logger.info(f"Successfully exported {len(trading_rules)} trading rules to Google Sheets")
             
@@ -7,19 +7,106 @@ Help Center: https://help.alpha-futures.com/en/
 """
 
 import re
+import asyncio
 import logging
+import weakref
 from typing import Dict, List, Optional, Any
-from playwright.async_api import Page
+from playwright.async_api import Page, BrowserContext, TimeoutError as PlaywrightTimeoutError
 from bs4 import BeautifulSoup
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, HTML_PARSER
 from ..config.enums import DrawdownType, PayoutFrequency, Platform, Broker
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once here instead of on every parse call
+SIZE_PATTERN = re.compile(r'\$(?:50|100),?000')  # $50,000 and $100,000 in one scan
+
+# Each list is tried in priority order, the first pattern that matches
+# anywhere in the text gives the value
+SPLIT_PATTERNS = (
+    re.compile(r'([0-9]+)%.*profit split'),
+    re.compile(r'([0-9]+)/([0-9]+).*split'),
+    re.compile(r'up to ([0-9]+)%'),
+    re.compile(r'([0-9]+)%.*payout'),
+    re.compile(r'([0-9]+)%.*share'),
+)
+
+MIN_PAYOUT_PATTERNS = (
+    re.compile(r'minimum payout[:\s]+\$?([0-9,]+)'),
+    re.compile(r'min[:\s]+\$?([0-9,]+)'),
+    re.compile(r'minimum[:\s]+\$?([0-9,]+)'),
+)
+
+FEE_PATTERNS = (
+    re.compile(r'activation fee[:\s]+\$?([0-9,]+)'),
+    re.compile(r'evaluation fee[:\s]+\$?([0-9,]+)'),
+    re.compile(r'fee[:\s]+\$?([0-9,]+)'),
+    re.compile(r'cost[:\s]+\$?([0-9,]+)'),
+)
+
+RESET_FEE_PATTERNS = (
+    re.compile(r'reset fee[:\s]+\$?([0-9,]+)'),
+    re.compile(r'retry fee[:\s]+\$?([0-9,]+)'),
+)
+
+
+def _first_match(patterns, text: str) -> Optional[re.Match]:
+    """Match of the first pattern, in list order, that occurs in text"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match
+    return None
+
+# Article body of a help-center page, waited for instead of network idle
+ARTICLE_SELECTOR = 'main, article, [data-testid="article-body"]'
+
+# Opens the help-center accordions so their text is part of the page content.
+# Registered once per browser context as an init script, so it runs on every
+# help-center load without a per-page evaluate. The host check keeps it off
+# other sites sharing the context. Only closed triggers are clicked, so an
+# accordion that is already open is never toggled shut.
+ACCORDION_INIT_SCRIPT = """
+    if (location.hostname === 'help.alpha-futures.com') {
+        window.addEventListener('load', () => {
+            const accordions = document.querySelectorAll('[data-testid="accordion-trigger"], .accordion-trigger, .collapsible-trigger, details');
+            accordions.forEach(acc => {
+                if (acc.tagName === 'DETAILS') {
+                    acc.open = true;
+                } else if (acc.getAttribute('aria-expanded') !== 'true') {
+                    acc.click();
+                }
+            });
+        });
+    }
+"""
+
+# Registration of ACCORDION_INIT_SCRIPT per browser context. Shared by every
+# extractor instance, and dropped with the context when it is recycled.
+_init_scripts: "weakref.WeakKeyDictionary[BrowserContext, asyncio.Future]" = weakref.WeakKeyDictionary()
+
+
+def _page_text(content: str) -> str:
+    """Lowercased text of an HTML document, collapsed accordion bodies included"""
+    return BeautifulSoup(content, HTML_PARSER).get_text().lower()
+
+
+def _detect_plan_type(text: str, advanced_marker: str) -> str:
+    """Plan an article describes, judged from its lowercased text"""
+    if 'zero' in text and '$0' in text:
+        return 'Zero'
+    if 'advanced' in text and advanced_marker in text:
+        return 'Advanced'
+    return 'Standard'
+
 
 class AlphaFuturesExtractor(BaseExtractor):
     """Extractor for Alpha Futures trading rules"""
     
+    # Rule methods read articles cached per URL, each loaded in its own page
+    size_concurrency = 4
+    rules_parallel_safe = True
+    
     def __init__(self, site_config):
         super().__init__(site_config)
         self.main_url = "https://alphafutures.io"
@@ -72,48 +159,95 @@ class AlphaFuturesExtractor(BaseExtractor):
             "/en/articles/9492048-consistency-rule",
             "/en/articles/11771813-zero-account-overview"
         ]
+        
+        # Evaluation and funded rules depend only on plan and size, so work
+        # them out once for every plan and every size listed in plan_data
+        all_sizes = {size for plan_info in self.plan_data.values() for size in plan_info['account_sizes']}
+        self._evaluation_table = {
+            (plan_type, size): self._compute_evaluation_rules(size, plan_type)
+            for plan_type in self.plan_data for size in all_sizes
+        }
+        self._funded_table = {
+            (plan_type, size): self._compute_funded_rules(size, plan_type)
+            for plan_type in self.plan_data for size in all_sizes
+        }
+        
+        # Page text by URL, so each article is loaded and parsed once per run.
+        # Holds the loading future, so concurrent callers share one load.
+        self._content_cache: Dict[str, asyncio.Future] = {}
+        
+        # Caps the article pages open at once. They are opened on the page's
+        # own context, outside BrowserManager's max_pages limit.
+        self._page_slots = asyncio.Semaphore(self.size_concurrency)
+
+    async def _load(self, page: Page, url: str) -> str:
+        """Return the lowercased text of url with accordions expanded, loading it on a cache miss"""
+        if url not in self._content_cache:
+            self._content_cache[url] = asyncio.ensure_future(self._fetch(page.context, url))
+        
+        try:
+            return await self._content_cache[url]
+        except Exception:
+            # Don't keep failures, the next caller retries
+            self._content_cache.pop(url, None)
+            raise
+
+    async def _fetch(self, context: BrowserContext, url: str) -> str:
+        """Load url in its own page, holding one of the extractor's page slots"""
+        if context not in _init_scripts:
+            _init_scripts[context] = asyncio.ensure_future(context.add_init_script(ACCORDION_INIT_SCRIPT))
+        try:
+            await _init_scripts[context]
+        except Exception:
+            # Don't keep a failed registration, the next load retries it
+            _init_scripts.pop(context, None)
+            raise
+        
+        async with self._page_slots:
+            page = await context.new_page()
+            try:
+                # The accordion script runs on load, so wait for it before reading
+                await page.goto(url, wait_until="load")
+                try:
+                    await page.wait_for_selector(ARTICLE_SELECTOR, timeout=5000)
+                except PlaywrightTimeoutError:
+                    logger.debug(f"No article element on {url}, reading the page as loaded")
+                
+                # Parsed from the HTML rather than inner_text, which leaves out
+                # the text of panels that are still hidden
+                return _page_text(await page.content())
+            finally:
+                await page.close()
+
+    async def _prefetch(self, page: Page):
+        """Load the articles in urls_to_visit up front, size_concurrency at a time, so the extract methods only read the cache"""
+        results = await asyncio.gather(
+            *(self._load(page, f"{self.help_url}{path}") for path in self.urls_to_visit),
+            return_exceptions=True
+        )
+        
+        # Failed loads are left out of the cache and retried by the extract method that needs them
+        for path, result in zip(self.urls_to_visit, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to prefetch {path}: {result}")
 
     async def get_account_sizes(self, page: Page) -> List[str]:
         """Extract all available account sizes"""
         logger.info("Extracting account sizes for Alpha Futures")
         
         try:
+            # Load all help-center articles in parallel, the overview is needed first
+            await self._prefetch(page)
+            
             # Start with help center for account size information
             help_url = f"{self.help_url}/en/articles/9491980-alpha-futures-evaluation-qualified-trader-overview"
-            await page.goto(help_url, wait_until="networkidle")
-            
-            # Expand accordions
-            await page.evaluate("""
-                const accordions = document.querySelectorAll('[data-testid="accordion-trigger"], .accordion-trigger, .collapsible-trigger, details');
-                accordions.forEach(acc => {
-                    if (acc.tagName === 'DETAILS') {
-                        acc.open = true;
-                    } else {
-                        acc.click();
-                    }
-                });
-            """)
-            
-            content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
+            text = await self._load(page, help_url)
             
             account_sizes = set()
             
-            # Look for common account size patterns
-            size_patterns = [
-                r'\$50,?000',
-                r'\$100,?000'
-            ]
-            
-            for pattern in size_patterns:
-                matches = re.findall(pattern, text)
-                for match in matches:
-                    # Normalize the format
-                    size = match.replace(',', '').replace('$', '')
-                    if size in ['50000', '100000']:  # Only include standard sizes
-                        formatted_size = f"${int(size):,}"
-                        account_sizes.add(formatted_size)
+            # Look for the standard account sizes, normalizing the format
+            for size in {match.replace(',', '').replace('$', '') for match in SIZE_PATTERN.findall(text)}:
+                account_sizes.add(f"${int(size):,}")
             
             # If no sizes found, use default from plan data
             if not account_sizes:
@@ -140,39 +274,16 @@ class AlphaFuturesExtractor(BaseExtractor):
         try:
             # Navigate to evaluation overview article
             url = f"{self.help_url}/en/articles/9491980-alpha-futures-evaluation-qualified-trader-overview"
-            await page.goto(url, wait_until="networkidle")
-            
-            # Expand accordions
-            await page.evaluate("""
-                const accordions = document.querySelectorAll('[data-testid="accordion-trigger"], .accordion-trigger, .collapsible-trigger, details');
-                accordions.forEach(acc => {
-                    if (acc.tagName === 'DETAILS') {
-                        acc.open = true;
-                    } else {
-                        acc.click();
-                    }
-                });
-            """)
-            
-            content = await page.content()
-            rules = await self._parse_evaluation_rules(content, account_size)
+            text = await self._load(page, url)
+            rules = await self._parse_evaluation_rules(account_size, _detect_plan_type(text, '8%'))
             
             # Visit consistency rule article for more details
             try:
                 consistency_url = f"{self.help_url}/en/articles/9492048-consistency-rule"
-                await page.goto(consistency_url, wait_until="networkidle")
-                await page.evaluate("""
-                    const accordions = document.querySelectorAll('[data-testid="accordion-trigger"], .accordion-trigger, .collapsible-trigger, details');
-                    accordions.forEach(acc => {
-                        if (acc.tagName === 'DETAILS') {
-                            acc.open = true;
-                        } else {
-                            acc.click();
-                        }
-                    });
-                """)
-                consistency_content = await page.content()
-                consistency_rules = await self._parse_evaluation_rules(consistency_content, account_size)
+                consistency_text = await self._load(page, consistency_url)
+                consistency_rules = await self._parse_evaluation_rules(
+                    account_size, _detect_plan_type(consistency_text, '8%')
+                )
                 rules.update(consistency_rules)
             except Exception as e:
                 logger.warning(f"Failed to extract consistency rules: {e}")
@@ -190,39 +301,14 @@ class AlphaFuturesExtractor(BaseExtractor):
         try:
             # Navigate to evaluation overview (contains funded rules too)
             url = f"{self.help_url}/en/articles/9491980-alpha-futures-evaluation-qualified-trader-overview"
-            await page.goto(url, wait_until="networkidle")
-            
-            # Expand accordions
-            await page.evaluate("""
-                const accordions = document.querySelectorAll('[data-testid="accordion-trigger"], .accordion-trigger, .collapsible-trigger, details');
-                accordions.forEach(acc => {
-                    if (acc.tagName === 'DETAILS') {
-                        acc.open = true;
-                    } else {
-                        acc.click();
-                    }
-                });
-            """)
-            
-            content = await page.content()
-            rules = await self._parse_funded_rules(content, account_size)
+            text = await self._load(page, url)
+            rules = await self._parse_funded_rules(account_size, _detect_plan_type(text, 'qualified'))
             
             # Visit Zero Account article for additional details
             try:
                 zero_url = f"{self.help_url}/en/articles/11771813-zero-account-overview"
-                await page.goto(zero_url, wait_until="networkidle")
-                await page.evaluate("""
-                    const accordions = document.querySelectorAll('[data-testid="accordion-trigger"], .accordion-trigger, .collapsible-trigger, details');
-                    accordions.forEach(acc => {
-                        if (acc.tagName === 'DETAILS') {
-                            acc.open = true;
-                        } else {
-                            acc.click();
-                        }
-                    });
-                """)
-                zero_content = await page.content()
-                zero_rules = await self._parse_funded_rules(zero_content, account_size)
+                zero_text = await self._load(page, zero_url)
+                zero_rules = await self._parse_funded_rules(account_size, _detect_plan_type(zero_text, 'qualified'))
                 rules.update(zero_rules)
             except Exception as e:
                 logger.warning(f"Failed to extract Zero Account rules: {e}")
@@ -240,22 +326,8 @@ class AlphaFuturesExtractor(BaseExtractor):
         try:
             # Navigate to payout policy article
             url = f"{self.help_url}/en/articles/9492051-payout-policy"
-            await page.goto(url, wait_until="networkidle")
-            
-            # Expand accordions
-            await page.evaluate("""
-                const accordions = document.querySelectorAll('[data-testid="accordion-trigger"], .accordion-trigger, .collapsible-trigger, details');
-                accordions.forEach(acc => {
-                    if (acc.tagName === 'DETAILS') {
-                        acc.open = true;
-                    } else {
-                        acc.click();
-                    }
-                });
-            """)
-            
-            content = await page.content()
-            rules = await self._parse_payout_rules(content, account_size)
+            text = await self._load(page, url)
+            rules = await self._parse_payout_rules(text, account_size)
             
             return rules
             
@@ -270,19 +342,8 @@ class AlphaFuturesExtractor(BaseExtractor):
         try:
             # Start with help center for Zero Account overview (mentions $0 fee)
             help_url = f"{self.help_url}/en/articles/11771813-zero-account-overview"
-            await page.goto(help_url, wait_until="networkidle")
-            await page.evaluate("""
-                const accordions = document.querySelectorAll('[data-testid="accordion-trigger"], .accordion-trigger, .collapsible-trigger, details');
-                accordions.forEach(acc => {
-                    if (acc.tagName === 'DETAILS') {
-                        acc.open = true;
-                    } else {
-                        acc.click();
-                    }
-                });
-            """)
-            content = await page.content()
-            rules = await self._parse_fee_rules(content, account_size)
+            text = await self._load(page, help_url)
+            rules = await self._parse_fee_rules(text, account_size)
             
             return rules
             
@@ -290,136 +351,118 @@ class AlphaFuturesExtractor(BaseExtractor):
             logger.error(f"Error extracting fee rules: {e}")
             return {}
 
-    async def _parse_evaluation_rules(self, content: str, account_size: str) -> Dict[str, Any]:
-        """Parse evaluation rules from HTML content"""
+    def _compute_evaluation_rules(self, account_size: str, plan_type: str) -> Dict[str, Any]:
+        """Calculate evaluation rules from the plan data for plan_type"""
         rules = {}
         
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
-            
-            # Determine account size value
-            account_value = float(account_size.replace('$', '').replace(',', ''))
-            
-            # Determine plan type based on content or account size
-            plan_type = 'Standard'  # Default
-            if 'zero' in text and '$0' in text:
-                plan_type = 'Zero'
-            elif 'advanced' in text and '8%' in text:
-                plan_type = 'Advanced'
-            
-            # Get plan data
-            plan_info = self.plan_data.get(plan_type, self.plan_data['Standard'])
-            
-            # Calculate profit target (percentage of account)
-            profit_target_percent = plan_info['profit_target_percent']
-            rules['profit_target_usd'] = account_value * (profit_target_percent / 100)
-            
-            # Calculate max drawdown (MLL - Maximum Loss Limit)
-            max_drawdown_percent = plan_info['max_drawdown_percent']
-            rules['max_drawdown_usd'] = account_value * (max_drawdown_percent / 100)
-            
-            # Daily loss limit (Daily Loss Guard - different from daily loss limit)
-            if plan_type == 'Zero':
-                if account_value <= 50000:
-                    rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard_50k'])
-                else:
-                    rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard_100k'])
+        # Determine account size value
+        account_value = float(account_size.replace('$', '').replace(',', ''))
+        
+        # Get plan data
+        plan_info = self.plan_data.get(plan_type, self.plan_data['Standard'])
+        
+        # Calculate profit target (percentage of account)
+        profit_target_percent = plan_info['profit_target_percent']
+        rules['profit_target_usd'] = account_value * (profit_target_percent / 100)
+        
+        # Calculate max drawdown (MLL - Maximum Loss Limit)
+        max_drawdown_percent = plan_info['max_drawdown_percent']
+        rules['max_drawdown_usd'] = account_value * (max_drawdown_percent / 100)
+        
+        # Daily loss limit (Daily Loss Guard - different from daily loss limit)
+        if plan_type == 'Zero':
+            if account_value <= 50000:
+                rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard_50k'])
             else:
-                rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard'])
-            
-            # Drawdown type (EOD - End of Day balance)
-            rules['drawdown_type'] = DrawdownType.EOD
-            
-            # Minimum trading days
-            rules['min_trading_days'] = plan_info['min_trading_days']
-            
-            # Consistency rule (50% during evaluation)
-            rules['consistency_rule'] = True  # All plans have consistency during evaluation
+                rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard_100k'])
+        else:
+            rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard'])
+        
+        # Drawdown type (EOD - End of Day balance)
+        rules['drawdown_type'] = DrawdownType.EOD
+        
+        # Minimum trading days
+        rules['min_trading_days'] = plan_info['min_trading_days']
+        
+        # Consistency rule (50% during evaluation)
+        rules['consistency_rule'] = True  # All plans have consistency during evaluation
+        
+        return rules
+
+    def _compute_funded_rules(self, account_size: str, plan_type: str) -> Dict[str, Any]:
+        """Calculate funded account rules from the plan data for plan_type"""
+        rules = {}
+        
+        # Determine account size value
+        account_value = float(account_size.replace('$', '').replace(',', ''))
+        
+        # Get plan data
+        plan_info = self.plan_data.get(plan_type, self.plan_data['Standard'])
+        
+        # Funded accounts have static drawdown ($2,000 for Standard, varies for Zero)
+        if plan_type == 'Standard':
+            rules['max_drawdown_usd'] = 2000.0  # $2,000 static drawdown
+        elif plan_type == 'Zero':
+            if account_value <= 50000:
+                rules['max_drawdown_usd'] = 2000.0  # $2,000 for $50K
+            else:
+                rules['max_drawdown_usd'] = 4000.0  # $4,000 for $100K
+        else:  # Advanced
+            rules['max_drawdown_usd'] = 2000.0  # Assume same as Standard
+        
+        # Daily loss guard (same as evaluation)
+        if plan_type == 'Zero':
+            if account_value <= 50000:
+                rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard_50k'])
+            else:
+                rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard_100k'])
+        else:
+            rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard'])
+        
+        # Drawdown type (Static for funded accounts)
+        rules['drawdown_type'] = DrawdownType.STATIC
+        
+        return rules
+
+    async def _parse_evaluation_rules(self, account_size: str, plan_type: str) -> Dict[str, Any]:
+        """Look up evaluation rules for plan_type, calculating them for sizes not in plan_data"""
+        try:
+            rules = self._evaluation_table.get((plan_type, account_size))
+            if rules is None:
+                rules = self._compute_evaluation_rules(account_size, plan_type)
             
             logger.info(f"Parsed evaluation rules for {plan_type}: {rules}")
-            return rules
+            # Callers merge into the result, so hand out a copy
+            return dict(rules)
             
         except Exception as e:
             logger.error(f"Error parsing evaluation rules: {e}")
             return {}
 
-    async def _parse_funded_rules(self, content: str, account_size: str) -> Dict[str, Any]:
-        """Parse funded account rules from HTML content"""
-        rules = {}
-        
+    async def _parse_funded_rules(self, account_size: str, plan_type: str) -> Dict[str, Any]:
+        """Look up funded account rules for plan_type, calculating them for sizes not in plan_data"""
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
-            
-            # Determine account size value
-            account_value = float(account_size.replace('$', '').replace(',', ''))
-            
-            # Determine plan type
-            plan_type = 'Standard'  # Default
-            if 'zero' in text and '$0' in text:
-                plan_type = 'Zero'
-            elif 'advanced' in text and 'qualified' in text:
-                plan_type = 'Advanced'
-            
-            # Get plan data
-            plan_info = self.plan_data.get(plan_type, self.plan_data['Standard'])
-            
-            # Funded accounts have static drawdown ($2,000 for Standard, varies for Zero)
-            if plan_type == 'Standard':
-                rules['max_drawdown_usd'] = 2000.0  # $2,000 static drawdown
-            elif plan_type == 'Zero':
-                if account_value <= 50000:
-                    rules['max_drawdown_usd'] = 2000.0  # $2,000 for $50K
-                else:
-                    rules['max_drawdown_usd'] = 4000.0  # $4,000 for $100K
-            else:  # Advanced
-                rules['max_drawdown_usd'] = 2000.0  # Assume same as Standard
-            
-            # Daily loss guard (same as evaluation)
-            if plan_type == 'Zero':
-                if account_value <= 50000:
-                    rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard_50k'])
-                else:
-                    rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard_100k'])
-            else:
-                rules['daily_loss_limit_usd'] = float(plan_info['daily_loss_guard'])
-            
-            # Drawdown type (Static for funded accounts)
-            rules['drawdown_type'] = DrawdownType.STATIC
+            rules = self._funded_table.get((plan_type, account_size))
+            if rules is None:
+                rules = self._compute_funded_rules(account_size, plan_type)
             
             logger.info(f"Parsed funded rules for {plan_type}: {rules}")
-            return rules
+            # Callers merge into the result, so hand out a copy
+            return dict(rules)
             
         except Exception as e:
             logger.error(f"Error parsing funded rules: {e}")
             return {}
 
-    async def _parse_payout_rules(self, content: str, account_size: str) -> Dict[str, Any]:
-        """Parse payout rules from HTML content"""
+    async def _parse_payout_rules(self, text: str, account_size: str) -> Dict[str, Any]:
+        """Parse payout rules from page text"""
         rules = {}
         
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
-            
-            # Extract profit split (up to 90%)
-            split_patterns = [
-                r'([0-9]+)%.*profit split',
-                r'([0-9]+)/([0-9]+).*split',
-                r'up to ([0-9]+)%',
-                r'([0-9]+)%.*payout',
-                r'([0-9]+)%.*share'
-            ]
-            
-            for pattern in split_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    if len(match.groups()) == 2:  # Format like "90/10"
-                        rules['profit_split_percent'] = int(match.group(1))
-                    else:  # Format like "90%"
-                        rules['profit_split_percent'] = int(match.group(1))
-                    break
+            # Extract profit split (up to 90%), from "90%", "90/10" or "up to 90%"
+            match = _first_match(SPLIT_PATTERNS, text)
+            if match:
+                rules['profit_split_percent'] = int(match.group(1))
             else:
                 rules['profit_split_percent'] = 90  # Default up to 90%
             
@@ -434,17 +477,9 @@ class AlphaFuturesExtractor(BaseExtractor):
                 rules['payout_frequency'] = PayoutFrequency.BIWEEKLY  # Default
             
             # Extract minimum payout
-            min_payout_patterns = [
-                r'minimum payout[:\s]+\$?([0-9,]+)',
-                r'min[:\s]+\$?([0-9,]+)',
-                r'minimum[:\s]+\$?([0-9,]+)'
-            ]
-            
-            for pattern in min_payout_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    rules['min_payout_usd'] = float(match.group(1).replace(',', ''))
-                    break
+            match = _first_match(MIN_PAYOUT_PATTERNS, text)
+            if match:
+                rules['min_payout_usd'] = float(match.group(1).replace(',', ''))
             else:
                 rules['min_payout_usd'] = 100  # Default assumption
             
@@ -455,14 +490,11 @@ class AlphaFuturesExtractor(BaseExtractor):
             logger.error(f"Error parsing payout rules: {e}")
             return {}
 
-    async def _parse_fee_rules(self, content: str, account_size: str) -> Dict[str, Any]:
-        """Parse fee information from HTML content"""
+    async def _parse_fee_rules(self, text: str, account_size: str) -> Dict[str, Any]:
+        """Parse fee information from page text"""
         rules = {}
         
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
-            
             # Determine account size value
             account_value = float(account_size.replace('$', '').replace(',', ''))
             
@@ -471,18 +503,9 @@ class AlphaFuturesExtractor(BaseExtractor):
                 rules['evaluation_fee_usd'] = 0.0
             else:
                 # Extract evaluation/activation fee
-                fee_patterns = [
-                    r'activation fee[:\s]+\$?([0-9,]+)',
-                    r'evaluation fee[:\s]+\$?([0-9,]+)',
-                    r'fee[:\s]+\$?([0-9,]+)',
-                    r'cost[:\s]+\$?([0-9,]+)'
-                ]
-                
-                for pattern in fee_patterns:
-                    match = re.search(pattern, text)
-                    if match:
-                        rules['evaluation_fee_usd'] = float(match.group(1).replace(',', ''))
-                        break
+                match = _first_match(FEE_PATTERNS, text)
+                if match:
+                    rules['evaluation_fee_usd'] = float(match.group(1).replace(',', ''))
                 else:
                     # Use estimated fees based on account size
                     if account_value <= 50000:
@@ -491,16 +514,9 @@ class AlphaFuturesExtractor(BaseExtractor):
                         rules['evaluation_fee_usd'] = 199  # Estimated for $100K
             
             # Extract reset fee (usually same as evaluation fee)
-            reset_patterns = [
-                r'reset fee[:\s]+\$?([0-9,]+)',
-                r'retry fee[:\s]+\$?([0-9,]+)'
-            ]
-            
-            for pattern in reset_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    rules['reset_fee_usd'] = float(match.group(1).replace(',', ''))
-                    break
+            match = _first_match(RESET_FEE_PATTERNS, text)
+            if match:
+                rules['reset_fee_usd'] = float(match.group(1).replace(',', ''))
             else:
                 rules['reset_fee_usd'] = rules.get('evaluation_fee_usd', 149)  # Default to same as evaluation
             
@@ -2,9 +2,11 @@
 Apex Trader Funding extractor
 """
 import re
+import asyncio
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
-from playwright.async_api import Page
+from playwright.async_api import Page, Route, TimeoutError as PlaywrightTimeoutError
 
 from .base_extractor import BaseExtractor
 from ..config.enums import DrawdownType, PayoutFrequency, Platform, Broker
@@ -13,16 +15,187 @@ from ..core.currency_converter import converter
 
 logger = logging.getLogger(__name__)
 
+# Help-center articles the rules are read from
+EVAL_RULES_URL = "https://support.apextraderfunding.com/hc/en-us/articles/31519769997083-Evaluation-Rules"
+PAYOUT_RULES_URL = "https://support.apextraderfunding.com/hc/en-us/articles/30306093336603-Apex-3-0-Payout-and-Trading-Rules"
+
+# Sizes used when none are found on the page, and the shorter list
+# returned when reading the page fails altogether
+DEFAULT_ACCOUNT_SIZES = (
+    "$25,000", "$50,000", "$75,000", "$100,000",
+    "$150,000", "$250,000", "$300,000"
+)
+FALLBACK_ACCOUNT_SIZES = ("$25,000", "$50,000", "$100,000", "$150,000", "$250,000")
+
+# Account size to evaluation fee mapping (approximate based on analysis of
+# the billing section, which lists no per-size prices to scrape)
+FEE_MAPPING = {
+    "$25,000": 147,
+    "$50,000": 247,
+    "$75,000": 347,
+    "$100,000": 397,
+    "$150,000": 497,
+    "$250,000": 597,
+    "$300,000": 677
+}
+DEFAULT_EVALUATION_FEE = 397
+
+# Reset fees (from analysis: $80 Rithmic, $100 Tradovate), we use the average
+RESET_FEE = 90.0
+
+# Requests the scrape never reads, blocked on top of the browser-wide
+# image/font/media filter. Text and tables are read from the DOM, so
+# styling isn't needed, and the Zendesk chat widget only keeps the
+# network busy.
+BLOCKED_RESOURCE_TYPES = {'stylesheet'}
+BLOCKED_HOST_PATTERN = re.compile(r'zdassets\.com|zopim\.com')
+
+# Article content, waited for instead of network idle
+CONTENT_SELECTOR = 'article, table, .article-body'
+
+# Patterns are compiled once here instead of on every call
+# All common account sizes in one alternation, so the page is scanned once
+SIZE_PATTERN = re.compile(r'\$(?:25|50|75|100|150|250|300),?000')
+
+# Gaps between keyword and number are bounded to 200 characters on the
+# same line, so a miss gives up quickly instead of backtracking the line
+PROFIT_TARGET_PATTERNS = [re.compile(p) for p in (
+    r'profit target[^\n]{0,200}?(\d+(?:\.\d+)?)\s*%',
+    r'(\d+(?:\.\d+)?)\s*%[^\n]{0,200}?profit target',
+    r'target[^\n]{0,200}?(\d+(?:\.\d+)?)\s*%',
+)]
+
+DAY_PATTERNS = [re.compile(p) for p in (
+    r'(\d+)\s+(?:trading\s+)?days?[^\n]{0,200}?minimum',
+    r'minimum[^\n]{0,200}?(\d+)\s+(?:trading\s+)?days?',
+    r'at least\s+(\d+)\s+(?:trading\s+)?days?',
+)]
+
+MIN_PAYOUT_PATTERNS = [re.compile(p) for p in (
+    r'minimum[^\n]{0,200}?\$([0-9,]+)',
+    r'\$([0-9,]+)[^\n]{0,200}?minimum',
+)]
+
+# Static drawdown mentioned as a word, not inside "statically" etc.
+STATIC_PATTERN = re.compile(r'\bstatic\b')
+
+# Header words that mark a table as the account size table; the details
+# table is matched on the same words without '$'
+SIZE_TABLE_KEYWORDS = ('account', 'size', '$')
+DETAILS_TABLE_KEYWORDS = ('account', 'size')
+
+# Reads every table's header and row cell text in one browser round-trip
+TABLES_SCRIPT = """
+() => Array.from(document.querySelectorAll('table')).map(table => ({
+    headers: Array.from(table.querySelectorAll('th')).map(th => th.textContent),
+    rows: Array.from(table.querySelectorAll('tr')).slice(1).map(
+        tr => Array.from(tr.querySelectorAll('td')).map(td => td.textContent)
+    )
+}))
+"""
+
+@lru_cache(maxsize=64)
+def _drawdown_patterns(account_size: str):
+    """
+    Drawdown patterns around one account size, compiled once per size
+    
+    Gaps stay on one line and are bounded like the module patterns, so a
+    size mentioned without a nearby amount fails fast.
+    """
+    size = re.escape(account_size)
+    return (
+        re.compile(rf'{size}[^\n]{{0,300}}?\$([0-9,]+)[^\n]{{0,100}}?(?:loss|drawdown)'),
+        re.compile(rf'(?:loss|drawdown)[^\n]{{0,100}}?\$([0-9,]+)[^\n]{{0,300}}?{size}'),
+    )
+
+@lru_cache(maxsize=256)
+def _parse_and_convert(text: str) -> Optional[float]:
+    """converter.parse_and_convert, memoized for the few distinct amounts on the pages"""
+    return converter.parse_and_convert(text)
+
 class ApexExtractor(BaseExtractor):
     """Extract trading rules from Apex Trader Funding website"""
     
+    # Rule methods read prefetched article text, cache misses are serialized
+    size_concurrency = 4
+    rules_parallel_safe = True
+    
+    __slots__ = (
+        'account_sizes_data', 'drawdown_by_size',
+        'evaluation_rules', 'funded_rules', 'payout_rules', 'fee_rules',
+        '_page_cache', '_static_pages', '_routed_page', '_load_lock'
+    )
+    
     def __init__(self, site_config):
         super().__init__(site_config)
         self.account_sizes_data = {}
+        # Max loss/drawdown from each size's table row, found once when the
+        # table is read instead of on every phase
+        self.drawdown_by_size: Dict[str, float] = {}
         self.evaluation_rules = {}
         self.funded_rules = {}
         self.payout_rules = {}
         self.fee_rules = {}
+        
+        # Lowercased article text by URL, so each is loaded, parsed and
+        # lowercased once instead of once per account size
+        self._page_cache: Dict[str, str] = {}
+        
+        # Whether each cached article mentions a static drawdown, searched
+        # once when the article is cached
+        self._static_pages: Dict[str, bool] = {}
+        
+        # Page the request filter is installed on
+        self._routed_page: Optional[Page] = None
+        
+        # Cache misses navigate the shared page, one at a time
+        self._load_lock = asyncio.Lock()
+    
+    async def _install_route_blockers(self, page: Page):
+        """Install the request filter on page once, before its first navigation"""
+        if self._routed_page is not page:
+            self._routed_page = page
+            await page.route('**/*', self._filter_request)
+    
+    async def _goto(self, page: Page, url: str):
+        """Navigate to url and wait for the article content, not for the network to go idle"""
+        await self._install_route_blockers(page)
+        await page.goto(url, wait_until='domcontentloaded')
+        try:
+            await page.wait_for_selector(CONTENT_SELECTOR, timeout=5000)
+        except PlaywrightTimeoutError:
+            logger.warning(f"No article content found on {url} within 5s, reading the page as loaded")
+    
+    async def _filter_request(self, route: Route):
+        """Abort stylesheets and widget requests, hand everything else to the browser-wide filter"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_HOST_PATTERN.search(request.url):
+            await route.abort()
+        else:
+            await route.fallback()
+    
+    async def _load(self, page: Page, url: str) -> str:
+        """Return the lowercased text of the article at url, navigating only on a cache miss"""
+        if url not in self._page_cache:
+            async with self._load_lock:
+                # Another extractor may have loaded it while this one waited
+                if url not in self._page_cache:
+                    if page.url != url:
+                        await self._goto(page, url)
+                    soup = await self.parse_html_content(page)
+                    text = soup.get_text().lower()
+                    self._static_pages[url] = STATIC_PATTERN.search(text) is not None
+                    self._page_cache[url] = text
+        return self._page_cache[url]
+    
+    async def _prefetch_pages(self, page: Page):
+        """Load each article once up front, the extract methods then only read the cache"""
+        for url in (EVAL_RULES_URL, PAYOUT_RULES_URL):
+            try:
+                await self._load(page, url)
+            except Exception as e:
+                # Left uncached, the extract method that needs it retries
+                logger.warning(f"Failed to prefetch {url}: {e}")
     
     async def get_account_sizes(self, page: Page) -> List[str]:
         """Extract all available account sizes from Apex website"""
@@ -30,70 +203,52 @@ class ApexExtractor(BaseExtractor):
             logger.info("Extracting account sizes from Apex")
             
             # Navigate to evaluation rules page
-            eval_rules_url = "https://support.apextraderfunding.com/hc/en-us/articles/31519769997083-Evaluation-Rules"
-            await page.goto(eval_rules_url)
-            await page.wait_for_load_state('networkidle')
+            await self._goto(page, EVAL_RULES_URL)
             
-            # Look for account size information in tables or text
-            account_sizes = []
+            # Look for account size information in tables or text, the dict
+            # keeps first-seen order and drops repeats in O(1)
+            found_sizes = {}
             
             # Try to find account size table or list
-            tables = await page.query_selector_all('table')
+            tables = await page.evaluate(TABLES_SCRIPT)
             
             for table in tables:
-                # Look for account size columns
-                headers = await table.query_selector_all('th')
-                header_texts = []
-                for header in headers:
-                    text = await header.text_content()
-                    if text:
-                        header_texts.append(text.strip())
+                # Look for account size columns, lowercased once per header
+                header_texts = [text.strip().lower() for text in table['headers'] if text]
                 
                 # Check if this looks like an account size table
-                if any('account' in h.lower() or 'size' in h.lower() or '$' in h for h in header_texts):
-                    rows = await table.query_selector_all('tr')
-                    
-                    for row in rows[1:]:  # Skip header row
-                        cells = await row.query_selector_all('td')
+                if any(keyword in h for h in header_texts for keyword in SIZE_TABLE_KEYWORDS):
+                    for cells in table['rows']:  # Header row already skipped
                         if cells:
-                            first_cell_text = await cells[0].text_content()
+                            first_cell_text = cells[0]
                             if first_cell_text and '$' in first_cell_text:
                                 # Clean and extract account size
-                                size = first_cell_text.strip()
-                                if size not in account_sizes:
-                                    account_sizes.append(size)
+                                found_sizes[first_cell_text.strip()] = None
+                    
+                    # The first table that lists sizes is the size table
+                    if found_sizes:
+                        break
+            
+            account_sizes = list(found_sizes)
             
             # If no table found, look for account sizes in text content
             if not account_sizes:
                 content = await page.content()
                 
-                # Common account size patterns
-                size_patterns = [
-                    r'\$25,?000',
-                    r'\$50,?000', 
-                    r'\$75,?000',
-                    r'\$100,?000',
-                    r'\$150,?000',
-                    r'\$250,?000',
-                    r'\$300,?000'
-                ]
-                
-                for pattern in size_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        if match not in account_sizes:
-                            account_sizes.append(match)
+                # Common account size patterns, deduplicated and listed smallest first
+                matches = dict.fromkeys(SIZE_PATTERN.findall(content))
+                account_sizes = sorted(matches, key=lambda size: int(size[1:].replace(',', '')))
             
             # Default account sizes if none found
             if not account_sizes:
-                account_sizes = [
-                    "$25,000", "$50,000", "$75,000", "$100,000", 
-                    "$150,000", "$250,000", "$300,000"
-                ]
+                account_sizes = list(DEFAULT_ACCOUNT_SIZES)
                 logger.warning("No account sizes found, using default list")
             
-            # Store account sizes data for later use
-            await self._extract_account_size_details(page, account_sizes)
+            # Store account sizes data for later use, from the tables already read
+            self._extract_account_size_details(tables, account_sizes)
+            
+            # Load the remaining articles once for all account sizes
+            await self._prefetch_pages(page)
             
             logger.info(f"Found {len(account_sizes)} account sizes: {account_sizes}")
             return account_sizes
@@ -101,37 +256,42 @@ class ApexExtractor(BaseExtractor):
         except Exception as e:
             logger.error(f"Error extracting account sizes: {e}")
             # Return default sizes as fallback
-            return ["$25,000", "$50,000", "$100,000", "$150,000", "$250,000"]
+            return list(FALLBACK_ACCOUNT_SIZES)
     
-    async def _extract_account_size_details(self, page: Page, account_sizes: List[str]):
-        """Extract detailed rules for each account size"""
+    def _extract_account_size_details(self, tables: List[Dict[str, Any]], account_sizes: List[str]):
+        """Extract detailed rules for each account size from TABLES_SCRIPT output"""
         try:
-            # Parse the current page content for account size details
-            soup = await self.parse_html_content(page)
-            
             # Look for tables with account size information
-            tables = soup.find_all('table')
-            
+            found_details = False
             for table in tables:
-                headers = [th.get_text().strip() for th in table.find_all('th')]
+                # Lowercased once, used both for the check and as detail keys
+                headers = [text.strip().lower() for text in table['headers']]
                 
                 # Check if this is an account size details table
-                if any('account' in h.lower() or 'size' in h.lower() for h in headers):
-                    rows = table.find_all('tr')[1:]  # Skip header
-                    
-                    for row in rows:
-                        cells = [td.get_text().strip() for td in row.find_all('td')]
+                if any(keyword in h for h in headers for keyword in DETAILS_TABLE_KEYWORDS):
+                    for row in table['rows']:  # Header row already skipped
+                        cells = [text.strip() for text in row]
                         
                         if cells and '$' in cells[0]:
                             account_size = cells[0]
                             
-                            # Extract details from table columns
-                            details = {}
-                            for i, header in enumerate(headers):
-                                if i < len(cells):
-                                    details[header.lower()] = cells[i]
+                            # Extract details from table columns, up to the shorter of the two
+                            details = dict(zip(headers, cells))
                             
                             self.account_sizes_data[account_size] = details
+                            found_details = True
+                            
+                            # First loss/drawdown/threshold column with an amount
+                            for key, value in details.items():
+                                if 'loss' in key or 'drawdown' in key or 'threshold' in key:
+                                    drawdown_amount = _parse_and_convert(value)
+                                    if drawdown_amount:
+                                        self.drawdown_by_size[account_size] = drawdown_amount
+                                        break
+                    
+                    # Stop at the first table that had size rows
+                    if found_details:
+                        break
             
         except Exception as e:
             logger.error(f"Error extracting account size details: {e}")
@@ -141,34 +301,20 @@ class ApexExtractor(BaseExtractor):
         try:
             logger.info(f"Extracting evaluation rules for {account_size}")
             
-            # Navigate to evaluation rules if not already there
-            current_url = page.url
-            if 'evaluation-rules' not in current_url.lower():
-                eval_rules_url = "https://support.apextraderfunding.com/hc/en-us/articles/31519769997083-Evaluation-Rules"
-                await page.goto(eval_rules_url)
-                await page.wait_for_load_state('networkidle')
-            
-            # Parse content
-            soup = await self.parse_html_content(page)
-            content_text = soup.get_text().lower()
+            # Parse content of the evaluation rules page
+            content_text = await self._load(page, EVAL_RULES_URL)
             
             rules = {}
             
             # Extract profit target (typically 6-8% of account size)
-            account_value = converter.parse_and_convert(account_size)
+            account_value = _parse_and_convert(account_size)
             if account_value:
                 # Look for profit target percentage in content
-                profit_target_patterns = [
-                    r'profit target.*?(\d+(?:\.\d+)?)\s*%',
-                    r'(\d+(?:\.\d+)?)\s*%.*?profit target',
-                    r'target.*?(\d+(?:\.\d+)?)\s*%'
-                ]
-                
                 profit_target_percent = None
-                for pattern in profit_target_patterns:
-                    matches = re.findall(pattern, content_text)
-                    if matches:
-                        profit_target_percent = float(matches[0])
+                for pattern in PROFIT_TARGET_PATTERNS:
+                    match = pattern.search(content_text)
+                    if match:
+                        profit_target_percent = float(match.group(1))
                         break
                 
                 # Default to 8% if not found
@@ -177,52 +323,33 @@ class ApexExtractor(BaseExtractor):
                 
                 rules['target_usd'] = account_value * (profit_target_percent / 100)
             
-            # Extract drawdown information
-            if account_size in self.account_sizes_data:
-                size_data = self.account_sizes_data[account_size]
-                
-                # Look for max loss/drawdown in the account size data
-                for key, value in size_data.items():
-                    if 'loss' in key or 'drawdown' in key or 'threshold' in key:
-                        drawdown_amount = converter.parse_and_convert(value)
-                        if drawdown_amount:
-                            rules['max_drawdown_usd'] = drawdown_amount
-                            break
+            # Extract drawdown information from the account size data
+            if account_size in self.drawdown_by_size:
+                rules['max_drawdown_usd'] = self.drawdown_by_size[account_size]
             
             # If no specific drawdown found, extract from general content
             if 'max_drawdown_usd' not in rules:
                 # Look for drawdown patterns in content
-                drawdown_patterns = [
-                    rf'{re.escape(account_size)}.*?\$([0-9,]+).*?(?:loss|drawdown)',
-                    rf'(?:loss|drawdown).*?\$([0-9,]+).*?{re.escape(account_size)}'
-                ]
-                
-                for pattern in drawdown_patterns:
-                    matches = re.findall(pattern, content_text)
-                    if matches:
-                        drawdown_amount = converter.parse_and_convert(f"${matches[0]}")
+                for pattern in _drawdown_patterns(account_size):
+                    match = pattern.search(content_text)
+                    if match:
+                        drawdown_amount = _parse_and_convert(f"${match.group(1)}")
                         if drawdown_amount:
                             rules['max_drawdown_usd'] = drawdown_amount
                             break
             
             # Determine drawdown type (trailing vs static)
-            if 'static' in content_text:
+            if self._static_pages[EVAL_RULES_URL]:
                 rules['drawdown_type'] = DrawdownType.STATIC
             else:
                 rules['drawdown_type'] = DrawdownType.TRAILING
             
             # Extract minimum trading days (typically 7 for Apex)
-            day_patterns = [
-                r'(\d+)\s+(?:trading\s+)?days?.*?minimum',
-                r'minimum.*?(\d+)\s+(?:trading\s+)?days?',
-                r'at least\s+(\d+)\s+(?:trading\s+)?days?'
-            ]
-            
             min_days = None
-            for pattern in day_patterns:
-                matches = re.findall(pattern, content_text)
-                if matches:
-                    min_days = int(matches[0])
+            for pattern in DAY_PATTERNS:
+                match = pattern.search(content_text)
+                if match:
+                    min_days = int(match.group(1))
                     break
             
             rules['min_days'] = min_days or 7  # Default to 7 days
@@ -244,25 +371,14 @@ class ApexExtractor(BaseExtractor):
         try:
             logger.info(f"Extracting funded rules for {account_size}")
             
-            # Navigate to performance accounts section
-            pa_url = "https://support.apextraderfunding.com/hc/en-us/articles/30306093336603-Apex-3-0-Payout-and-Trading-Rules"
-            await page.goto(pa_url)
-            await page.wait_for_load_state('networkidle')
-            
-            soup = await self.parse_html_content(page)
-            content_text = soup.get_text().lower()
+            # Performance accounts section
+            content_text = await self._load(page, PAYOUT_RULES_URL)
             
             rules = {}
             
             # Same drawdown as evaluation phase
-            if account_size in self.account_sizes_data:
-                size_data = self.account_sizes_data[account_size]
-                for key, value in size_data.items():
-                    if 'loss' in key or 'drawdown' in key or 'threshold' in key:
-                        drawdown_amount = converter.parse_and_convert(value)
-                        if drawdown_amount:
-                            rules['max_drawdown_usd'] = drawdown_amount
-                            break
+            if account_size in self.drawdown_by_size:
+                rules['max_drawdown_usd'] = self.drawdown_by_size[account_size]
             
             # Drawdown type (trailing for funded accounts)
             rules['drawdown_type'] = DrawdownType.TRAILING
@@ -283,15 +399,8 @@ class ApexExtractor(BaseExtractor):
         try:
             logger.info(f"Extracting payout rules for {account_size}")
             
-            # Navigate to payout rules if not already there
-            current_url = page.url
-            if 'payout' not in current_url.lower():
-                payout_url = "https://support.apextraderfunding.com/hc/en-us/articles/30306093336603-Apex-3-0-Payout-and-Trading-Rules"
-                await page.goto(payout_url)
-                await page.wait_for_load_state('networkidle')
-            
-            soup = await self.parse_html_content(page)
-            content_text = soup.get_text().lower()
+            # Payout rules page
+            content_text = await self._load(page, PAYOUT_RULES_URL)
             
             rules = {}
             
@@ -303,16 +412,11 @@ class ApexExtractor(BaseExtractor):
             rules['payout_frequency'] = PayoutFrequency.BIWEEKLY
             
             # Minimum payout ($500)
-            min_payout_patterns = [
-                r'minimum.*?\$([0-9,]+)',
-                r'\$([0-9,]+).*?minimum'
-            ]
-            
             min_payout = None
-            for pattern in min_payout_patterns:
-                matches = re.findall(pattern, content_text)
-                if matches:
-                    min_payout = converter.parse_and_convert(f"${matches[0]}")
+            for pattern in MIN_PAYOUT_PATTERNS:
+                match = pattern.search(content_text)
+                if match:
+                    min_payout = _parse_and_convert(f"${match.group(1)}")
                     break
             
             rules['min_payout_usd'] = min_payout or 500.0  # Default to $500
@@ -328,37 +432,12 @@ class ApexExtractor(BaseExtractor):
         try:
             logger.info(f"Extracting fee rules for {account_size}")
             
-            # Navigate to billing section
-            billing_url = "https://support.apextraderfunding.com/hc/en-us/sections/31319717565851-Everything-Billing-Subscriptions-Cancellations-Resets"
-            await page.goto(billing_url)
-            await page.wait_for_load_state('networkidle')
-            
-            # Look for fee information
-            soup = await self.parse_html_content(page)
-            content_text = soup.get_text().lower()
-            
-            rules = {}
-            
-            # Account size to fee mapping (approximate based on analysis)
-            fee_mapping = {
-                "$25,000": 147,
-                "$50,000": 247,
-                "$75,000": 347,
-                "$100,000": 397,
-                "$150,000": 497,
-                "$250,000": 597,
-                "$300,000": 677
+            # Fees come from the mapping, no page is read
+            return {
+                'evaluation_fee_usd': FEE_MAPPING.get(account_size, DEFAULT_EVALUATION_FEE),
+                'reset_fee_usd': RESET_FEE  # Average across platforms
             }
             
-            # Get evaluation fee for this account size
-            rules['evaluation_fee_usd'] = fee_mapping.get(account_size, 397)  # Default to $397
-            
-            # Reset fees (from analysis: $80 Rithmic, $100 Tradovate)
-            # We'll use average
-            rules['reset_fee_usd'] = 90.0
-            
-            return rules
-            
         except Exception as e:
             logger.error(f"Error extracting fee rules for {account_size}: {e}")
             return {}
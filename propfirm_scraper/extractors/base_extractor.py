@@ -1,10 +1,15 @@
 """
 Base extractor class for all website extractors
 """
+import os
+import re
 import json
+import asyncio
 import logging
+from functools import lru_cache
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from enum import Enum
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -16,16 +21,107 @@ from ..config.enums import Status
 from ..core.currency_converter import converter
 from ..core.utils import extract_number, extract_percentage, classify_drawdown_type, classify_payout_frequency
 
+# orjson serializes raw data much faster than the json module, fall back
+# to it when orjson isn't installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# lxml parses in C; fall back to the built-in parser when it isn't installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Reads the header cells and data-row cells of every matching table in one
+# browser round-trip. Rows come back as lists so header order is kept exactly
+# (a JS object would move numeric-looking headers to the front).
+TABLE_DATA_SCRIPT = """
+selector => Array.from(document.querySelectorAll(selector)).map(table => {
+    const rows = Array.from(table.querySelectorAll('tr'));
+    if (!rows.length) return null;
+    return {
+        headers: Array.from(rows[0].querySelectorAll('th, td')).map(cell => (cell.textContent || '').trim()),
+        rows: rows.slice(1).map(
+            row => Array.from(row.querySelectorAll('td')).map(cell => (cell.textContent || '').trim())
+        )
+    };
+}).filter(Boolean)
+"""
+
+# Where save_raw_data writes its debug JSON files
+RAW_DATA_DIR = Path("propfirm_scraper/data/raw")
+
+@lru_cache(maxsize=None)
+def _raw_data_dir() -> Path:
+    """RAW_DATA_DIR, created on first use instead of on every save"""
+    RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    return RAW_DATA_DIR
+
+def _json_default(value: Any) -> Any:
+    """Enums as their value and datetimes in ISO format, the way orjson writes them"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def _write_atomic(filepath: Path, payload: bytes):
+    """Write payload to a temporary file next to filepath, then move it into place"""
+    tmp_path = filepath.with_suffix('.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, filepath)
+
+@lru_cache(maxsize=64)
+def _keyword_search(keywords: Tuple[str, ...]) -> Tuple[re.Pattern, str]:
+    """
+    One case-insensitive alternation of the keywords and the matching
+    Playwright text selector, both built once per keyword set
+    """
+    alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+    return re.compile(alternation, re.IGNORECASE), f"text=/{alternation}/i"
+
 class BaseExtractor(ABC):
     """Abstract base class for all website extractors"""
     
+    # Subclasses that declare their own __slots__ carry no instance __dict__
+    __slots__ = ('site_config', 'firm_name', 'base_url', 'raw_data', '_last_soup', '_firm_name_clean')
+    
+    # Account sizes extracted at once, all on the page passed to
+    # extract_all_rules. Only raise it in extractors whose rule methods don't
+    # navigate that page after get_account_sizes (they read cached content
+    # or open their own pages).
+    size_concurrency = 1
+    
+    # Whether the four rule methods for one size may run concurrently. Same
+    # condition as above: they must not navigate or click the shared page.
+    rules_parallel_safe = False
+    
+    # Skip the funded, payout and fee extractors for a size whose evaluation
+    # rules have no profit target; the size is then reported as MISSING_DATA.
+    # Only for sites where a missing target means the size isn't offered.
+    # Only applies when the rule methods run one after another.
+    fail_fast_on_missing_target = False
+    
+    # What find_text_by_keywords scans before querying for an element:
+    # 'visible' reads the body's rendered text, 'html' the full page HTML
+    # (for keywords that only appear in markup, e.g. attributes)
+    keyword_search_mode = 'visible'
+    
     def __init__(self, site_config: SiteConfig):
         self.site_config = site_config
         self.firm_name = site_config.name
         self.base_url = site_config.url
         self.raw_data = {}
+        # Firm name as used in raw data file names
+        self._firm_name_clean = self.firm_name.lower().replace(" ", "_").replace("-", "_")
+        # Last parsed document and its HTML, reused while the HTML is unchanged
+        self._last_soup: Optional[Tuple[str, BeautifulSoup]] = None
     
     @abstractmethod
     async def get_account_sizes(self, page: Page) -> List[str]:
@@ -112,6 +208,36 @@ class BaseExtractor(ABC):
         """
         return {'broker': None, 'platform': None}
     
+    async def extract_size_rules(self, page: Page, account_size: str) -> Tuple[Dict[str, Any], ...]:
+        """
+        Extract evaluation, funded, payout and fee rules for one account size
+        
+        Runs the four extractors concurrently when rules_parallel_safe is set,
+        otherwise one after another on the shared page, stopping after the
+        evaluation rules when fail_fast_on_missing_target is set and they
+        have no profit target.
+        """
+        if self.rules_parallel_safe:
+            return tuple(await asyncio.gather(
+                self.extract_evaluation_rules(page, account_size),
+                self.extract_funded_rules(page, account_size),
+                self.extract_payout_rules(page, account_size),
+                self.extract_fee_rules(page, account_size)
+            ))
+        
+        evaluation_rules = await self.extract_evaluation_rules(page, account_size)
+        
+        if self.fail_fast_on_missing_target and (
+            evaluation_rules.get('profit_target_usd') is None and evaluation_rules.get('target_usd') is None
+        ):
+            logger.info(f"No profit target for {account_size}, skipping remaining rule extraction")
+            return evaluation_rules, {}, {}, {}
+        
+        funded_rules = await self.extract_funded_rules(page, account_size)
+        payout_rules = await self.extract_payout_rules(page, account_size)
+        fee_rules = await self.extract_fee_rules(page, account_size)
+        return evaluation_rules, funded_rules, payout_rules, fee_rules
+    
     async def extract_all_rules(self, page: Page) -> List[TradingRule]:
         """
         Extract all trading rules for all account sizes
@@ -141,14 +267,25 @@ class BaseExtractor(ABC):
             # Extract broker and platform info (common for all account sizes)
             broker_platform = await self.extract_broker_platform(page)
             
+            # USD value of each account size, parsed once per size
+            size_usd = {size: converter.parse_and_convert(size) for size in account_sizes}
+            
+            # Sizes whose amount or currency can't be parsed are dropped up
+            # front and kept in raw_data, so missing parsing rules show up
+            unparseable = [size for size in account_sizes if size_usd[size] is None]
+            if unparseable:
+                self.raw_data['unparseable_sizes'] = unparseable
+                logger.info(f"Skipping {', '.join(unparseable)} - amount or currency not recognised")
+            
             # Filter account sizes to minimum 50K USD
-            filtered_account_sizes = []
-            for account_size in account_sizes:
-                account_size_usd = converter.parse_and_convert(account_size) or 0.0
-                if account_size_usd >= 50000:  # Minimum 50K USD
-                    filtered_account_sizes.append(account_size)
-                else:
-                    logger.info(f"Skipping {account_size} (${account_size_usd:,.0f}) - below 50K minimum")
+            parsed_sizes = [size for size in account_sizes if size_usd[size] is not None]
+            filtered_account_sizes = [size for size in parsed_sizes if size_usd[size] >= 50000]
+            
+            if len(filtered_account_sizes) < len(parsed_sizes):
+                skipped = ", ".join(
+                    f"{size} (${size_usd[size]:,.0f})" for size in parsed_sizes if size_usd[size] < 50000
+                )
+                logger.info(f"Skipping {skipped} - below 50K minimum")
             
             if not filtered_account_sizes:
                 logger.warning(f"No account sizes >= 50K found for {self.firm_name}")
@@ -162,79 +299,25 @@ class BaseExtractor(ABC):
                 )
                 return [rule]
             
-            # Extract rules for each filtered account size
-            for account_size in filtered_account_sizes:
-                try:
-                    logger.info(f"Extracting rules for {self.firm_name} - {account_size}")
-                    
-                    # Convert account size to USD
-                    account_size_usd = converter.parse_and_convert(account_size) or 0.0
-                    
-                    # Extract all rule types
-                    evaluation_rules = await self.extract_evaluation_rules(page, account_size)
-                    funded_rules = await self.extract_funded_rules(page, account_size)
-                    payout_rules = await self.extract_payout_rules(page, account_size)
-                    fee_rules = await self.extract_fee_rules(page, account_size)
-                    
-                    # Create trading rule object
-                    rule = TradingRule(
-                        firm_name=self.firm_name,
-                        account_size=account_size,
-                        account_size_usd=account_size_usd,
-                        website_url=self.base_url,
-                        broker=broker_platform.get('broker'),
-                        platform=broker_platform.get('platform'),
-                        
-                        # Evaluation rules
-                        evaluation_target_usd=evaluation_rules.get('profit_target_usd') or evaluation_rules.get('target_usd'),
-                        evaluation_max_drawdown_usd=evaluation_rules.get('max_drawdown_usd'),
-                        evaluation_daily_loss_usd=evaluation_rules.get('daily_loss_limit_usd'),
-                        evaluation_drawdown_type=evaluation_rules.get('drawdown_type'),
-                        evaluation_min_days=evaluation_rules.get('min_trading_days') or evaluation_rules.get('min_days'),
-                        evaluation_consistency=evaluation_rules.get('consistency_rule') or evaluation_rules.get('consistency'),
-                        
-                        # Funded rules
-                        funded_max_drawdown_usd=funded_rules.get('max_drawdown_usd'),
-                        funded_daily_loss_usd=funded_rules.get('daily_loss_limit_usd'),
-                        funded_drawdown_type=funded_rules.get('drawdown_type'),
-                        
-                        # Payout rules
-                        profit_split_percent=payout_rules.get('profit_split_percent'),
-                        payout_frequency=payout_rules.get('payout_frequency'),
-                        min_payout_usd=payout_rules.get('min_payout_usd'),
-                        
-                        # Fee rules
-                        evaluation_fee_usd=fee_rules.get('evaluation_fee_usd'),
-                        reset_fee_usd=fee_rules.get('reset_fee_usd'),
-                        
-                        # Store raw data for debugging
-                        raw_data={
-                            'account_size': account_size,
-                            'evaluation': evaluation_rules,
-                            'funded': funded_rules,
-                            'payout': payout_rules,
-                            'fees': fee_rules,
-                            'broker_platform': broker_platform
-                        }
-                    )
-                    
-                    # Validate and set status
-                    rule.status = self._validate_rule(rule)
-                    
-                    trading_rules.append(rule)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to extract rules for {account_size}: {e}")
-                    
-                    # Create rule with failed status
-                    rule = TradingRule(
-                        firm_name=self.firm_name,
-                        account_size=account_size,
-                        account_size_usd=converter.parse_and_convert(account_size) or 0.0,
-                        website_url=self.base_url,
-                        status=Status.FAILED
-                    )
-                    trading_rules.append(rule)
+            # Extract rules for each filtered account size, in order
+            if self.size_concurrency > 1:
+                size_slots = asyncio.Semaphore(self.size_concurrency)
+                
+                async def extract_limited(account_size: str) -> TradingRule:
+                    async with size_slots:
+                        return await self._extract_size(page, account_size, size_usd[account_size], broker_platform)
+                
+                # _extract_size turns failures into FAILED rules, so the group
+                # only aborts on cancellation, and then cancels every size
+                async with asyncio.TaskGroup() as size_tasks:
+                    tasks = [
+                        size_tasks.create_task(extract_limited(account_size))
+                        for account_size in filtered_account_sizes
+                    ]
+                trading_rules.extend(task.result() for task in tasks)
+            else:
+                for account_size in filtered_account_sizes:
+                    trading_rules.append(await self._extract_size(page, account_size, size_usd[account_size], broker_platform))
             
             logger.info(f"Extracted {len(trading_rules)} rules for {self.firm_name}")
             
@@ -253,6 +336,75 @@ class BaseExtractor(ABC):
         
         return trading_rules
     
+    async def _extract_size(self, page: Page, account_size: str, account_size_usd: float,
+                            broker_platform: Dict[str, Any]) -> TradingRule:
+        """Extract the trading rule for one account size, a FAILED rule if extraction raises"""
+        try:
+            logger.info(f"Extracting rules for {self.firm_name} - {account_size}")
+            
+            # Extract all rule types
+            evaluation_rules, funded_rules, payout_rules, fee_rules = await self.extract_size_rules(page, account_size)
+            
+            # Create trading rule object
+            rule = TradingRule(
+                firm_name=self.firm_name,
+                account_size=account_size,
+                account_size_usd=account_size_usd,
+                website_url=self.base_url,
+                broker=broker_platform.get('broker'),
+                platform=broker_platform.get('platform'),
+                
+                # Evaluation rules
+                evaluation_target_usd=evaluation_rules.get('profit_target_usd') or evaluation_rules.get('target_usd'),
+                evaluation_max_drawdown_usd=evaluation_rules.get('max_drawdown_usd'),
+                evaluation_daily_loss_usd=evaluation_rules.get('daily_loss_limit_usd'),
+                evaluation_drawdown_type=evaluation_rules.get('drawdown_type'),
+                evaluation_min_days=evaluation_rules.get('min_trading_days') or evaluation_rules.get('min_days'),
+                evaluation_consistency=evaluation_rules.get('consistency_rule') or evaluation_rules.get('consistency'),
+                
+                # Funded rules
+                funded_max_drawdown_usd=funded_rules.get('max_drawdown_usd'),
+                funded_daily_loss_usd=funded_rules.get('daily_loss_limit_usd'),
+                funded_drawdown_type=funded_rules.get('drawdown_type'),
+                
+                # Payout rules
+                profit_split_percent=payout_rules.get('profit_split_percent'),
+                payout_frequency=payout_rules.get('payout_frequency'),
+                min_payout_usd=payout_rules.get('min_payout_usd'),
+                
+                # Fee rules
+                evaluation_fee_usd=fee_rules.get('evaluation_fee_usd'),
+                reset_fee_usd=fee_rules.get('reset_fee_usd'),
+                
+                # Store raw data for debugging
+                raw_data={
+                    'account_size': account_size,
+                    'evaluation': evaluation_rules,
+                    'funded': funded_rules,
+                    'payout': payout_rules,
+                    'fees': fee_rules,
+                    'broker_platform': broker_platform
+                }
+            )
+            
+            # Validate and set status
+            rule.status = self._validate_rule(rule)
+            
+            return rule
+            
+        except Exception as e:
+            logger.error(f"Failed to extract rules for {account_size}: {e}")
+            
+            # Create rule with failed status
+            rule = TradingRule(
+                firm_name=self.firm_name,
+                account_size=account_size,
+                account_size_usd=account_size_usd,
+                website_url=self.base_url,
+                status=Status.FAILED
+            )
+            return rule
+    
     def _validate_rule(self, rule: TradingRule) -> Status:
         """
         Validate a trading rule and determine its status
@@ -260,14 +412,12 @@ class BaseExtractor(ABC):
         Returns:
             Status enum indicating the validation result
         """
-        # Check if critical fields are missing
-        critical_fields = [
-            rule.evaluation_target_usd,
-            rule.evaluation_max_drawdown_usd,
-            rule.profit_split_percent
-        ]
-        
-        missing_critical = sum(1 for field in critical_fields if field is None)
+        # Count missing critical fields, without building a list
+        missing_critical = (
+            (rule.evaluation_target_usd is None)
+            + (rule.evaluation_max_drawdown_usd is None)
+            + (rule.profit_split_percent is None)
+        )
         
         if missing_critical > 1:  # Allow one missing critical field
             return Status.MISSING_DATA
@@ -277,20 +427,22 @@ class BaseExtractor(ABC):
     async def save_raw_data(self, data: Dict[str, Any], account_size: str = "all"):
         """Save raw extracted data to JSON file for debugging"""
         try:
-            # Create data directory if it doesn't exist
-            data_dir = Path("propfirm_scraper/data/raw")
-            data_dir.mkdir(parents=True, exist_ok=True)
+            # Data directory, created once per process
+            data_dir = _raw_data_dir()
             
             # Create filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            firm_name_clean = self.firm_name.lower().replace(" ", "_").replace("-", "_")
-            filename = f"{firm_name_clean}_{account_size}_{timestamp}.json"
+            filename = f"{self._firm_name_clean}_{account_size}_{timestamp}.json"
             
             filepath = data_dir / filename
             
-            # Save data
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            # Serialize here, write in a worker thread so the event loop isn't
+            # blocked on disk I/O
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+            await asyncio.to_thread(_write_atomic, filepath, payload)
             
             logger.info(f"Raw data saved to {filepath}")
             
@@ -302,15 +454,24 @@ class BaseExtractor(ABC):
     async def find_text_by_keywords(self, page: Page, keywords: List[str]) -> Optional[str]:
         """Find text on page that contains any of the given keywords"""
         try:
-            content = await page.content()
-            content_lower = content.lower()
+            if not keywords:
+                return None
             
-            for keyword in keywords:
-                if keyword.lower() in content_lower:
-                    # Try to find the specific element containing this keyword
-                    elements = await page.query_selector_all(f"text=/{keyword}/i")
-                    if elements:
-                        return await elements[0].text_content()
+            pattern, selector = _keyword_search(tuple(keywords))
+            
+            # Visible text is usually a fraction of the HTML's size, and is
+            # what the text selector below matches against
+            if self.keyword_search_mode == 'html':
+                content = await page.content()
+            else:
+                content = await page.inner_text('body')
+            
+            # One scan for all keywords
+            if pattern.search(content):
+                # Find the first element containing any keyword in one query
+                element = await page.query_selector(selector)
+                if element:
+                    return await element.text_content()
             
             return None
             
@@ -321,41 +482,21 @@ class BaseExtractor(ABC):
     async def extract_table_data(self, page: Page, table_selector: str = "table") -> List[Dict[str, str]]:
         """Extract data from HTML table"""
         try:
-            tables = await page.query_selector_all(table_selector)
-            
-            if not tables:
-                return []
+            # All tables' cell text in one evaluate call instead of one
+            # round-trip per row and cell
+            tables = await page.evaluate(TABLE_DATA_SCRIPT, table_selector)
             
             table_data = []
             
             for table in tables:
-                rows = await table.query_selector_all("tr")
-                
-                if not rows:
-                    continue
+                # Headers come from the first row
+                headers = table['headers']
+                column_count = len(headers)
                 
-                # Get headers from first row
-                header_row = rows[0]
-                headers = []
-                header_cells = await header_row.query_selector_all("th, td")
-                
-                for cell in header_cells:
-                    text = await cell.text_content()
-                    headers.append(text.strip() if text else "")
-                
-                # Get data rows
-                for row in rows[1:]:
-                    cells = await row.query_selector_all("td")
-                    
-                    if len(cells) != len(headers):
-                        continue
-                    
-                    row_data = {}
-                    for i, cell in enumerate(cells):
-                        text = await cell.text_content()
-                        row_data[headers[i]] = text.strip() if text else ""
-                    
-                    table_data.append(row_data)
+                # Get data rows, skipping rows that don't line up with the headers
+                table_data.extend(
+                    dict(zip(headers, cells)) for cells in table['rows'] if len(cells) == column_count
+                )
             
             return table_data
             
@@ -364,13 +505,23 @@ class BaseExtractor(ABC):
             return []
     
     async def parse_html_content(self, page: Page) -> BeautifulSoup:
-        """Parse page HTML content using BeautifulSoup with built-in parser"""
+        """
+        Parse page HTML content using BeautifulSoup, with lxml when installed
+        
+        The soup is shared while the page HTML is unchanged, so callers must
+        only read it.
+        """
         try:
             html_content = await page.content()
-            # Use html.parser (built-in) instead of lxml to avoid compilation issues
-            soup = BeautifulSoup(html_content, 'html.parser')
+            
+            # Same document as last time, skip the parse
+            if self._last_soup is not None and self._last_soup[0] == html_content:
+                return self._last_soup[1]
+            
+            soup = BeautifulSoup(html_content, HTML_PARSER)
+            self._last_soup = (html_content, soup)
             return soup
             
         except Exception as e:
             logger.error(f"Error parsing HTML content: {e}")
-            return BeautifulSoup("", 'html.parser')
\ No newline at end of file
+            return BeautifulSoup("", HTML_PARSER)
\ No newline at end of file
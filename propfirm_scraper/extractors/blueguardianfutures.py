@@ -9,13 +9,38 @@ Help Center: https://help.blueguardianfutures.com/en/
 import re
 import logging
 from typing import Dict, List, Optional, Any
-from playwright.async_api import Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from bs4 import BeautifulSoup
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, HTML_PARSER
 from ..config.enums import DrawdownType, PayoutFrequency, Platform, Broker
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once here instead of on every call
+# All four account sizes in one alternation, so the text is scanned once
+SIZE_PATTERN = re.compile(r'\$(?:25|50|100|150),?000')
+
+# Tried in order, the first that matches gives the minimum payout
+MIN_PAYOUT_PATTERNS = [re.compile(p) for p in (
+    r'minimum payout[:\s]+\$?([0-9,]+)',
+    r'min[:\s]+\$?([0-9,]+)',
+    r'minimum[:\s]+\$?([0-9,]+)',
+)]
+
+# Content waited for after navigation instead of fixed pauses. <main> is
+# already in the initial HTML, so it is only a fallback once these time out.
+MAIN_CONTENT_SELECTOR = '#evaluation, .pricing'
+HELP_CONTENT_SELECTOR = 'article, .article-body'
+FALLBACK_CONTENT_SELECTOR = 'main'
+
+# Help-center links that lead to payout articles
+PAYOUT_HREF_PATTERN = re.compile(r'payout|withdrawal|payment')
+
+
+def _page_text(content: str) -> str:
+    """Lowercased visible text of an HTML document"""
+    return BeautifulSoup(content, HTML_PARSER).get_text().lower()
+
 
 class BlueGuardianFuturesExtractor(BaseExtractor):
     """Extractor for Blue Guardian Futures trading rules"""
@@ -25,6 +50,10 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
         self.main_url = "https://blueguardianfutures.com"
         self.help_url = "https://help.blueguardianfutures.com/en"
         
+        # Main website HTML, loaded once and shared by get_account_sizes and
+        # the evaluation, funded and fee rules of every account size
+        self._main_content: Optional[str] = None
+        
         # Account type data mapping based on research
         self.evaluation_types = {
             'Standard Guardian': {
@@ -179,55 +208,47 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
             'platforms': ['Tradovate', 'ProjectX', 'Volsys']
         }
 
+    async def _get_main_content(self, page: Page) -> str:
+        """Return the main website HTML, navigating only on the first call"""
+        if self._main_content is None:
+            await page.goto(self.main_url, wait_until="networkidle")
+            
+            # Wait for the evaluation section or pricing to render
+            await self._wait_for_content(page, MAIN_CONTENT_SELECTOR)
+            
+            self._main_content = await page.content()
+        return self._main_content
+
+    async def _wait_for_content(self, page: Page, selector: str):
+        """Wait for selector to become visible, then for <main>, reading the page as loaded if neither shows up"""
+        try:
+            await page.wait_for_selector(selector, state='visible', timeout=10000)
+            return
+        except PlaywrightTimeoutError:
+            logger.debug(f"{selector} not found on {page.url}, falling back to {FALLBACK_CONTENT_SELECTOR}")
+        
+        try:
+            await page.wait_for_selector(FALLBACK_CONTENT_SELECTOR, state='visible', timeout=2000)
+        except PlaywrightTimeoutError:
+            logger.warning(f"{selector} not found on {page.url}, continuing with content parsing")
+
     async def get_account_sizes(self, page: Page) -> List[str]:
         """Extract all available account sizes"""
         logger.info("Extracting account sizes for Blue Guardian Futures")
         
         try:
-            # Navigate to main website homepage
-            await page.goto(self.main_url, wait_until="networkidle")
-            
-            # Wait for dynamic content to load
-            await page.wait_for_timeout(3000)
-            
-            # Look for evaluation section
-            try:
-                await page.wait_for_selector('#evaluation', timeout=10000)
-            except:
-                logger.warning("Evaluation section not found, continuing with content parsing")
-            
-            content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
+            # Main website homepage, cached for the rule methods
+            content = await self._get_main_content(page)
+            text = _page_text(content)
             
             account_sizes = set()
             
-            # Look for account size patterns in content
-            size_patterns = [
-                r'\$25,?000',
-                r'\$50,?000', 
-                r'\$100,?000',
-                r'\$150,?000'
-            ]
-            
-            for pattern in size_patterns:
-                matches = re.findall(pattern, text)
-                for match in matches:
-                    # Normalize the format
-                    size = match.replace(',', '').replace('$', '')
-                    formatted_size = f"${int(size):,}"
-                    account_sizes.add(formatted_size)
-            
-            # Also look for evaluation cards or tables
-            evaluation_sections = soup.find_all(['div', 'section'], class_=re.compile(r'evaluation|card|pricing'))
-            for section in evaluation_sections:
-                section_text = section.get_text().lower()
-                for pattern in size_patterns:
-                    matches = re.findall(pattern, section_text)
-                    for match in matches:
-                        size = match.replace(',', '').replace('$', '')
-                        formatted_size = f"${int(size):,}"
-                        account_sizes.add(formatted_size)
+            # Look for account size patterns in content. Evaluation cards and
+            # tables are part of the page text, so this covers them too.
+            for match in SIZE_PATTERN.findall(text):
+                # Normalize the format
+                size = match.replace(',', '').replace('$', '')
+                account_sizes.add(f"${int(size):,}")
             
             # If no sizes found, use predefined data
             if not account_sizes:
@@ -255,11 +276,8 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
         logger.info(f"Extracting evaluation rules for {account_size}")
         
         try:
-            # Navigate to main website for evaluation data
-            await page.goto(self.main_url, wait_until="networkidle")
-            await page.wait_for_timeout(3000)
-            
-            content = await page.content()
+            # Main website for evaluation data
+            content = await self._get_main_content(page)
             rules = await self._parse_evaluation_rules(content, account_size)
             
             return rules
@@ -275,10 +293,7 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
         
         try:
             # Use same content as evaluation (rules apply to both phases)
-            await page.goto(self.main_url, wait_until="networkidle")
-            await page.wait_for_timeout(3000)
-            
-            content = await page.content()
+            content = await self._get_main_content(page)
             rules = await self._parse_funded_rules(content, account_size)
             
             return rules
@@ -296,14 +311,14 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
             # Try help center for detailed payout info
             try:
                 await page.goto(self.help_url, wait_until="networkidle")
-                await page.wait_for_timeout(2000)
+                await self._wait_for_content(page, HELP_CONTENT_SELECTOR)
                 
                 # Look for payout-related articles
                 content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = BeautifulSoup(content, HTML_PARSER)
                 
                 # Find links to payout articles
-                payout_links = soup.find_all('a', href=re.compile(r'payout|withdrawal|payment'))
+                payout_links = soup.find_all('a', href=PAYOUT_HREF_PATTERN)
                 if payout_links:
                     # Navigate to first payout article
                     first_link = payout_links[0]
@@ -312,13 +327,13 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
                         if href.startswith('/'):
                             href = f"{self.help_url}{href}"
                         await page.goto(href, wait_until="networkidle")
-                        await page.wait_for_timeout(2000)
+                        await self._wait_for_content(page, HELP_CONTENT_SELECTOR)
                         
             except Exception as e:
                 logger.warning(f"Failed to navigate to help center: {e}")
                 # Fallback to main website
                 await page.goto(self.main_url, wait_until="networkidle")
-                await page.wait_for_timeout(3000)
+                await self._wait_for_content(page, MAIN_CONTENT_SELECTOR)
             
             content = await page.content()
             rules = await self._parse_payout_rules(content, account_size)
@@ -335,10 +350,7 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
         
         try:
             # Main website has pricing in evaluation cards
-            await page.goto(self.main_url, wait_until="networkidle")
-            await page.wait_for_timeout(3000)
-            
-            content = await page.content()
+            content = await self._get_main_content(page)
             rules = await self._parse_fee_rules(content, account_size)
             
             return rules
@@ -352,8 +364,7 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
         rules = {}
         
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
+            text = _page_text(content)
             
             # Determine evaluation type (default to Standard Guardian for evaluation)
             eval_type = self._determine_evaluation_type(account_size, text, prefer_evaluation=True)
@@ -408,8 +419,7 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
         rules = {}
         
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
+            text = _page_text(content)
             
             # Determine evaluation type
             eval_type = self._determine_evaluation_type(account_size, text)
@@ -450,8 +460,7 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
         rules = {}
         
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
+            text = _page_text(content)
             
             # Tiered profit split (100% for first $15K, 90% after)
             rules['profit_split_percent'] = self.general_rules['profit_split_after_15k']  # Use 90% as primary
@@ -460,14 +469,8 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
             rules['payout_frequency'] = self.general_rules['payout_frequency']
             
             # Minimum payout (try to extract or use reasonable default)
-            min_payout_patterns = [
-                r'minimum payout[:\s]+\$?([0-9,]+)',
-                r'min[:\s]+\$?([0-9,]+)',
-                r'minimum[:\s]+\$?([0-9,]+)'
-            ]
-            
-            for pattern in min_payout_patterns:
-                match = re.search(pattern, text)
+            for pattern in MIN_PAYOUT_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     rules['min_payout_usd'] = float(match.group(1).replace(',', ''))
                     break
@@ -486,8 +489,7 @@ class BlueGuardianFuturesExtractor(BaseExtractor):
         rules = {}
         
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            text = soup.get_text().lower()
+            text = _page_text(content)
             
             # Determine evaluation type
             eval_type = self._determine_evaluation_type(account_size, text)
@@ -88,6 +88,7 @@ class PropFirmScraper:
     
     async def scrape_site(self, site_name: str, site_config: Dict[str, Any]) -> List[TradingRule]:
         """Scrape a single website"""
+        page = None
         try:
             logger.info(f"Starting scrape for {site_name}")
             
@@ -136,7 +137,6 @@ class PropFirmScraper:
                     website_url=config.url,
                     status=Status.LOGIN_REQUIRED
                 )
-                await page.close()
                 return [rule]
             
             # Expand accordions to reveal content
@@ -146,9 +146,6 @@ class PropFirmScraper:
             extractor = extractor_class(config)
             trading_rules = await extractor.extract_all_rules(page)
             
-            # Close page
-            await page.close()
-            
             logger.info(f"Completed scrape for {site_name}: {len(trading_rules)} rules extracted")
             return trading_rules
             
@@ -165,6 +162,11 @@ class PropFirmScraper:
             )
             rule.raw_data = {'error': str(e)}
             return [rule]
+        
+        finally:
+            # Always close the page so its browser page slot is released
+            if page is not None:
+                await page.close()
     
     async def scrape_all_sites(self):
         """Scrape all configured websites"""
@@ -174,25 +176,38 @@ class PropFirmScraper:
             # Initialize browser
             self.browser_manager = BrowserManager(
                 headless=self.global_settings.get('headless', True),
-                timeout=self.global_settings.get('page_timeout', 30000)
+                timeout=self.global_settings.get('page_timeout', 30000),
+                max_pages=self.global_settings.get('max_pages', 8),
+                recycle_every=self.global_settings.get('context_recycle_pages', 10)
             )
             
             await self.browser_manager.start()
             
-            # Process sites
+            # Process sites concurrently, up to concurrent_sites at a time
+            site_slots = asyncio.Semaphore(self.global_settings.get('concurrent_sites', 3))
+            
+            async def process_site(site_name: str, site_config: Dict[str, Any]) -> List[TradingRule]:
+                async with site_slots:
+                    try:
+                        site_results = await self.scrape_site(site_name, site_config)
+                        
+                        # Small delay before this slot takes the next site
+                        await asyncio.sleep(2)
+                        return site_results
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing site {site_name}: {e}")
+                        return []
+            
+            site_results = await asyncio.gather(*(
+                process_site(site_name, site_config)
+                for site_name, site_config in self.sites_config.items()
+            ))
+            
+            # Keep results in configuration order
             all_results = []
-            
-            for site_name, site_config in self.sites_config.items():
-                try:
-                    site_results = await self.scrape_site(site_name, site_config)
-                    all_results.extend(site_results)
-                    
-                    # Small delay between sites
-                    await asyncio.sleep(2)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing site {site_name}: {e}")
-                    continue
+            for results in site_results:
+                all_results.extend(results)
             
             self.results = all_results
             logger.info(f"Completed scraping all sites: {len(self.results)} total rules")